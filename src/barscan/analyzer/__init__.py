@@ -21,6 +21,7 @@ from barscan.analyzer.models import (
     AnalysisConfig,
     AnalysisResult,
     ContextsMode,
+    TokenColumns,
     TokenWithPosition,
     WordContext,
     WordFrequency,
@@ -29,11 +30,16 @@ from barscan.analyzer.processor import (
     clean_lyrics,
     clean_lyrics_preserve_lines,
     ensure_nltk_resources,
+    has_section_headers,
     lemmatize,
+    lemmatize_many,
     normalize_text,
     preprocess,
+    preprocess_many,
     tokenize,
     tokenize_with_positions,
+    tokenize_with_positions_batch,
+    tokenize_with_positions_columnar,
 )
 
 __all__ = [
@@ -43,16 +49,22 @@ __all__ = [
     "AggregateAnalysisResult",
     "WordFrequency",
     "ContextsMode",
+    "TokenColumns",
     "TokenWithPosition",
     "WordContext",
     # Processor
     "clean_lyrics",
     "clean_lyrics_preserve_lines",
+    "has_section_headers",
     "normalize_text",
     "tokenize",
     "tokenize_with_positions",
+    "tokenize_with_positions_batch",
+    "tokenize_with_positions_columnar",
     "lemmatize",
+    "lemmatize_many",
     "preprocess",
+    "preprocess_many",
     "ensure_nltk_resources",
     # Filters
     "filter_stop_words",
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from barscan.analyzer.models import ContextsMode, TokenWithPosition, WordContext
 
 if TYPE_CHECKING:
     pass
 
+# Pattern to match characters stripped from a word before comparison
+NON_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^\w']")
+
 
 def extract_short_context(
     line: str,
@@ -37,7 +40,7 @@ def extract_short_context(
     word_index = -1
     for i, w in enumerate(words):
         # Strip punctuation for comparison
-        clean_w = re.sub(r"[^\w']", "", w.lower())
+        clean_w = NON_WORD_PATTERN.sub("", w.lower())
         if clean_w == word_lower:
             word_index = i
             break
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from nltk.corpus import stopwords
 
+from barscan.analyzer.models import DEFAULT_CONFIG
 from barscan.analyzer.stopwords_ja import get_japanese_stop_words
 from barscan.analyzer.tokenizer import detect_language, is_japanese_char
 from barscan.exceptions import NLTKResourceError
@@ -32,9 +33,7 @@ def get_stop_words(config: AnalysisConfig | None = None, text: str | None = None
         NLTKResourceError: If NLTK stopwords corpus is not available.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     language = config.language
     if language == "auto":
@@ -83,9 +82,7 @@ def filter_stop_words(
         Filtered list of tokens with stop words removed.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     if not config.remove_stop_words:
         return tokens
@@ -118,9 +115,7 @@ def filter_by_length(tokens: list[str], config: AnalysisConfig | None = None) ->
         Filtered list of tokens meeting minimum length requirement.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     return [token for token in tokens if len(token) >= config.min_word_length]
 
@@ -163,9 +158,7 @@ def filter_non_alphabetic(
         Filtered list of valid word tokens.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     language = config.language
     if language == "auto":
@@ -201,9 +194,7 @@ def apply_filters(
         Filtered list of tokens.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     # Apply default filters in order
     filtered = filter_non_alphabetic(tokens, config, text)
@@ -8,13 +8,14 @@ from typing import TYPE_CHECKING
 
 from barscan.analyzer.filters import apply_filters
 from barscan.analyzer.models import (
+    DEFAULT_CONFIG,
     AggregateAnalysisResult,
     AnalysisConfig,
     AnalysisResult,
     TokenWithPosition,
     WordFrequency,
 )
-from barscan.analyzer.processor import preprocess, tokenize_with_positions
+from barscan.analyzer.processor import preprocess, tokenize_with_positions_batch
 from barscan.exceptions import EmptyLyricsError
 
 if TYPE_CHECKING:
@@ -85,7 +86,7 @@ def analyze_text(
         EmptyLyricsError: If text is empty or contains only whitespace.
     """
     if config is None:
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     # Preprocess text
     tokens = preprocess(text, config)
@@ -170,7 +171,7 @@ def aggregate_results(
         AggregateAnalysisResult with combined frequencies.
     """
     if config is None:
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     if not results:
         return AggregateAnalysisResult(
@@ -229,6 +230,7 @@ def get_word_counts_per_song(
 def collect_tokens_with_positions(
     lyrics_data: list[tuple[str, int, str]],
     config: AnalysisConfig | None = None,
+    n_workers: int = 1,
 ) -> list[TokenWithPosition]:
     """Collect tokens with position information from multiple songs.
 
@@ -237,24 +239,17 @@ def collect_tokens_with_positions(
     Args:
         lyrics_data: List of (lyrics_text, song_id, song_title) tuples.
         config: Analysis configuration (uses default if None).
+        n_workers: Number of worker processes used for tokenization
+            (1 processes songs sequentially).
 
     Returns:
         Combined list of TokenWithPosition from all songs.
     """
     if config is None:
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     all_tokens: list[TokenWithPosition] = []
-    for lyrics_text, song_id, song_title in lyrics_data:
-        try:
-            tokens = tokenize_with_positions(
-                text=lyrics_text,
-                song_id=song_id,
-                song_title=song_title,
-                config=config,
-            )
-            all_tokens.extend(tokens)
-        except EmptyLyricsError:
-            continue
+    for tokens in tokenize_with_positions_batch(lyrics_data, config, n_workers=n_workers):
+        all_tokens.extend(tokens)
 
     return all_tokens
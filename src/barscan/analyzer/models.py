@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from typing import Final
 
 from pydantic import BaseModel, Field
 
@@ -40,6 +43,9 @@ class AnalysisConfig(BaseModel, frozen=True):
         remove_stop_words: Whether to filter out stop words.
         custom_stop_words: Additional stop words to filter.
         language: Language for NLTK processing.
+        use_nltk_tokenizer: Whether to use NLTK word_tokenize instead of the regex
+            tokenizer for English. NLTK splits contractions such as gonna, cannot
+            and don't into separate tokens; the regex keeps them whole.
         compute_tfidf: Whether to compute TF-IDF scores.
         compute_pos: Whether to compute POS tags.
         compute_sentiment: Whether to compute sentiment scores.
@@ -62,6 +68,10 @@ class AnalysisConfig(BaseModel, frozen=True):
         default=True,
         description="Filter by part-of-speech for Japanese (keep nouns, verbs, adjectives)",
     )
+    use_nltk_tokenizer: bool = Field(
+        default=False,
+        description="Use NLTK word_tokenize instead of the regex tokenizer for English text",
+    )
 
     # Enhanced NLP analysis options
     compute_tfidf: bool = Field(default=False, description="Whether to compute TF-IDF scores")
@@ -76,6 +86,11 @@ class AnalysisConfig(BaseModel, frozen=True):
     )
 
 
+# Shared default configuration used when callers pass config=None.
+# AnalysisConfig is frozen, so a single instance can be reused safely.
+DEFAULT_CONFIG: Final[AnalysisConfig] = AnalysisConfig()
+
+
 class AnalysisResult(BaseModel, frozen=True):
     """Result of word frequency analysis on lyrics.
 
@@ -168,6 +183,56 @@ class TokenWithPosition(BaseModel, frozen=True):
     song_title: str = Field(..., description="Title of the song")
 
 
+@dataclass(frozen=True, slots=True)
+class TokenColumns:
+    """Column-oriented tokens with position information for a single song.
+
+    Holds one column per field instead of one TokenWithPosition per token, so
+    scans over a single field only touch that column. This is a plain dataclass
+    rather than a pydantic model: columns are filled internally by the
+    tokenizer and are not validated.
+
+    Attributes:
+        song_id: Genius song ID.
+        song_title: Title of the song.
+        tokens: Normalized word tokens.
+        line_indices: Zero-based line index of each token.
+        word_indices: Zero-based word index of each token within its line.
+        lines: Original line text, indexed by line index.
+    """
+
+    song_id: int
+    song_title: str
+    tokens: list[str] = field(default_factory=list)
+    line_indices: array[int] = field(default_factory=lambda: array("I"))
+    word_indices: array[int] = field(default_factory=lambda: array("I"))
+    lines: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Return the number of tokens."""
+        return len(self.tokens)
+
+    def to_tokens(self) -> list[TokenWithPosition]:
+        """Convert columns to row-oriented TokenWithPosition objects.
+
+        Returns:
+            List of tokens with their position information.
+        """
+        return [
+            TokenWithPosition.model_construct(
+                token=token,
+                line_index=line_index,
+                word_index=word_index,
+                original_line=self.lines[line_index],
+                song_id=self.song_id,
+                song_title=self.song_title,
+            )
+            for token, line_index, word_index in zip(
+                self.tokens, self.line_indices, self.word_indices, strict=True
+            )
+        ]
+
+
 class WordContext(BaseModel, frozen=True):
     """A context example for a word occurrence.
 
@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 import re
+import sys
+import threading
+import unicodedata
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING, Final
 
 from nltk.stem import WordNetLemmatizer
@@ -19,27 +25,35 @@ from barscan.exceptions import EmptyLyricsError, NLTKResourceError
 if TYPE_CHECKING:
     from barscan.analyzer.models import AnalysisConfig
 
-from barscan.analyzer.models import TokenWithPosition
+from barscan.analyzer.models import DEFAULT_CONFIG, TokenColumns, TokenWithPosition
 
-# Pattern to match section headers like [Verse 1], [Chorus], [Bridge], etc.
-SECTION_HEADER_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r"\[([A-Za-z0-9\s\-:]+)\]",
-    re.IGNORECASE,
-)
-
-# Pattern to match non-word characters (except apostrophes for contractions)
-PUNCTUATION_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^\w\s']")
+# Pattern to match section headers like [Verse 1], [Chorus], [Bridge: Artist & Artist].
+# A negated class cannot run past "]" or a newline, so matching is linear and a
+# header never spans lines; stripping the whole text in one pass is therefore
+# the same as stripping each line.
+SECTION_HEADER_PATTERN: Final[re.Pattern[str]] = re.compile(r"\[[^\]\n]+\]")
 
-# Pattern to match standalone apostrophes
-STANDALONE_APOSTROPHE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?<!\w)'|'(?!\w)")
+# Pattern for the default English tokenizer: words with optional contraction
+# suffixes (don't, y'all, rock'n'roll) kept as single tokens. Unlike NLTK's
+# word_tokenize it does not split gonna/wanna/gotta/cannot or n't/'s clitics.
+FAST_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+(?:'\w+)*")
 
 # Module-level cached lemmatizer for performance
 _lemmatizer: WordNetLemmatizer | None = None
+_lemmatizer_lock = threading.Lock()
+
+# Set once PROCESSOR_RESOURCES have been verified, so later calls skip nltk.data.find
+_nltk_resources_ready: bool = False
+_nltk_resources_lock = threading.Lock()
 
 
 def _get_lemmatizer() -> WordNetLemmatizer:
     """Get or create the WordNet lemmatizer.
 
+    The lemmatizer is created lazily on first use and shared across threads.
+    WordNet itself loads on the first lemmatize() call, so that happens here
+    under the lock rather than in whichever caller gets there first.
+
     Returns:
         WordNetLemmatizer instance.
 
@@ -48,23 +62,73 @@ def _get_lemmatizer() -> WordNetLemmatizer:
     """
     global _lemmatizer
     if _lemmatizer is None:
-        ensure_nltk_resources()
-        try:
-            _lemmatizer = WordNetLemmatizer()
-        except LookupError as e:
-            raise NLTKResourceError(f"NLTK WordNet initialization failed: {e}") from e
+        with _lemmatizer_lock:
+            if _lemmatizer is None:
+                ensure_nltk_resources()
+                try:
+                    lemmatizer = WordNetLemmatizer()
+                    lemmatizer.lemmatize("warmup")
+                except LookupError as e:
+                    raise NLTKResourceError(f"NLTK WordNet initialization failed: {e}") from e
+                _lemmatizer = lemmatizer
     return _lemmatizer
 
 
+def _lemmatize_unique(tokens: list[str], lemmas: dict[str, str] | None = None) -> list[str]:
+    """Lemmatize tokens, looking up each distinct token in WordNet only once.
+
+    Lyrics repeat heavily, so deduplicating before lemmatization cuts WordNet
+    lookups from one per token to one per unique word.
+
+    Args:
+        tokens: List of word tokens.
+        lemmas: Optional token-to-lemma cache shared across calls. Tokens
+            already present are not looked up again; new lemmas are added.
+
+    Returns:
+        List of lemmatized tokens in the original order.
+
+    Raises:
+        NLTKResourceError: If WordNet is not available.
+    """
+    if lemmas is None:
+        lemmas = {}
+    unseen = set(tokens).difference(lemmas)
+    if unseen:
+        lemmatizer = _get_lemmatizer()
+        for token in unseen:
+            lemmas[token] = sys.intern(lemmatizer.lemmatize(token))
+    return [lemmas[token] for token in tokens]
+
+
 def ensure_nltk_resources() -> None:
     """Ensure required NLTK resources are downloaded.
 
-    Downloads punkt tokenizer, stopwords, and wordnet if not present.
+    Downloads punkt tokenizer, stopwords, and wordnet if not present. The check
+    runs once per process; subsequent calls return immediately.
 
     Raises:
         NLTKResourceError: If resources cannot be downloaded.
     """
-    ensure_resources(PROCESSOR_RESOURCES)
+    global _nltk_resources_ready
+    if _nltk_resources_ready:
+        return
+    with _nltk_resources_lock:
+        if not _nltk_resources_ready:
+            ensure_resources(PROCESSOR_RESOURCES)
+            _nltk_resources_ready = True
+
+
+def has_section_headers(text: str) -> bool:
+    """Check whether text contains section headers like [Verse 1] or [Chorus].
+
+    Args:
+        text: Text to check.
+
+    Returns:
+        True if at least one section header is present, False otherwise.
+    """
+    return "[" in text and SECTION_HEADER_PATTERN.search(text) is not None
 
 
 def clean_lyrics(text: str) -> str:
@@ -84,10 +148,12 @@ def clean_lyrics(text: str) -> str:
     if not text or not text.strip():
         raise EmptyLyricsError("Lyrics text is empty or contains only whitespace")
 
-    # Remove section headers
-    cleaned = SECTION_HEADER_PATTERN.sub("", text)
+    # Remove section headers. Every header contains "[", so a C-level substring
+    # scan lets text without brackets skip the regex engine entirely.
+    cleaned = SECTION_HEADER_PATTERN.sub("", text) if "[" in text else text
 
-    # Normalize whitespace
+    # Normalize whitespace. str.split/join runs in C and is faster than folding
+    # whitespace collapsing into the header regex with a replacement callback.
     cleaned = " ".join(cleaned.split())
 
     return cleaned
@@ -96,9 +162,10 @@ def clean_lyrics(text: str) -> str:
 def normalize_text(text: str, config: AnalysisConfig | None = None) -> str:
     """Normalize text for analysis.
 
+    Applies NFKC normalization first, then:
     For English: Converts to lowercase, removes punctuation (except apostrophes
     in contractions), and normalizes whitespace.
-    For Japanese: Applies NFKC normalization and removes common punctuation.
+    For Japanese: Removes common punctuation and normalizes whitespace.
 
     Args:
         text: Text to normalize.
@@ -108,9 +175,7 @@ def normalize_text(text: str, config: AnalysisConfig | None = None) -> str:
         Normalized text.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     language = config.language
     if language == "auto":
@@ -122,7 +187,10 @@ def normalize_text(text: str, config: AnalysisConfig | None = None) -> str:
 def tokenize(text: str, config: AnalysisConfig | None = None) -> list[str]:
     """Tokenize text into words using appropriate tokenizer.
 
-    For English: Uses NLTK word_tokenize.
+    For English: Uses a precompiled regex that keeps contractions whole
+    ("gonna", "cannot", "don't"), or NLTK word_tokenize, which splits them
+    ("gon" + "na", "can" + "not", "do" + "n't"), when
+    ``config.use_nltk_tokenizer`` is enabled.
     For Japanese: Uses Janome morphological analyzer with optional POS filtering.
 
     Args:
@@ -137,15 +205,33 @@ def tokenize(text: str, config: AnalysisConfig | None = None) -> list[str]:
         ImportError: If Janome is not installed (for Japanese).
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     language = config.language
     if language == "auto":
         language = detect_language(text)
 
+    return _tokenize_for_language(text, language, config)
+
+
+def _tokenize_for_language(text: str, language: str, config: AnalysisConfig) -> list[str]:
+    """Tokenize text with the tokenizer for an already resolved language.
+
+    Args:
+        text: Text to tokenize.
+        language: Resolved language ('english' or 'japanese').
+        config: Analysis configuration.
+
+    Returns:
+        List of word tokens.
+
+    Raises:
+        NLTKResourceError: If NLTK resources are not available (for English).
+        ImportError: If Janome is not installed (for Japanese).
+    """
     if language == "english":
+        if not config.use_nltk_tokenizer:
+            return FAST_TOKEN_PATTERN.findall(text)
         ensure_nltk_resources()
 
     tokenizer = get_tokenizer(language, text)
@@ -179,9 +265,7 @@ def lemmatize(
         NLTKResourceError: If NLTK WordNet is not available.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     if not config.use_lemmatization:
         return tokens
@@ -194,8 +278,35 @@ def lemmatize(
     if language == "japanese":
         return tokens
 
-    lemmatizer = _get_lemmatizer()
-    return [lemmatizer.lemmatize(token) for token in tokens]
+    return _lemmatize_unique(tokens)
+
+
+def lemmatize_many(
+    token_lists: Iterable[list[str]], config: AnalysisConfig | None = None
+) -> list[list[str]]:
+    """Lemmatize several token lists, sharing WordNet lookups between them.
+
+    Songs by the same artist share most of their vocabulary, so each distinct
+    token is looked up once across all lists instead of once per list.
+
+    Args:
+        token_lists: Token lists to lemmatize, e.g. one per song.
+        config: Analysis configuration (uses default if None).
+
+    Returns:
+        Lemmatized token lists in the same order as the input.
+
+    Raises:
+        NLTKResourceError: If NLTK WordNet is not available.
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    if not config.use_lemmatization or config.language == "japanese":
+        return list(token_lists)
+
+    lemmas: dict[str, str] = {}
+    return [_lemmatize_unique(tokens, lemmas) for tokens in token_lists]
 
 
 def preprocess(text: str, config: AnalysisConfig | None = None) -> list[str]:
@@ -206,23 +317,102 @@ def preprocess(text: str, config: AnalysisConfig | None = None) -> list[str]:
         config: Analysis configuration (uses default if None).
 
     Returns:
-        List of preprocessed word tokens.
+        List of preprocessed word tokens. Every token is lowercased, so no
+        token contains uppercase letters.
 
     Raises:
         EmptyLyricsError: If text is empty or whitespace only.
         NLTKResourceError: If NLTK resources are not available.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
+        config = DEFAULT_CONFIG
+
+    return _preprocess(text, config)
+
+
+def preprocess_many(
+    texts: Iterable[str],
+    config: AnalysisConfig | None = None,
+    n_workers: int = 1,
+    chunksize: int = 64,
+) -> Iterator[list[str]]:
+    """Preprocess several lyrics texts, sharing lemma lookups between them.
+
+    Equivalent to calling preprocess on each text, except that with
+    lemmatization enabled each distinct token is looked up in WordNet once
+    across all texts rather than once per text.
+
+    Tokenization is pure Python (Janome in particular is CPU-bound), so with
+    ``n_workers > 1`` texts are distributed across a process pool instead.
+    Each worker loads its own tokenizer and lemmatizer; for a handful of songs
+    the startup cost outweighs the gain and the sequential path is faster.
+
+    Args:
+        texts: Raw lyrics texts, e.g. one per song.
+        config: Analysis configuration (uses default if None).
+        n_workers: Number of worker processes. 1 (default) processes texts
+            sequentially in the current process.
+        chunksize: Number of texts sent to a worker per task.
+
+    Yields:
+        List of preprocessed word tokens for each text, in input order.
+
+    Raises:
+        EmptyLyricsError: If a text is empty or whitespace only.
+        NLTKResourceError: If NLTK resources are not available.
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    if n_workers <= 1:
+        lemmas: dict[str, str] = {}
+        for text in texts:
+            yield _preprocess(text, config, lemmas)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        yield from executor.map(partial(_preprocess, config=config), texts, chunksize=chunksize)
+
+
+def _preprocess(
+    text: str, config: AnalysisConfig, lemmas: dict[str, str] | None = None
+) -> list[str]:
+    """Run the preprocessing pipeline on one text.
 
-        config = AnalysisConfig()
+    Args:
+        text: Raw lyrics text.
+        config: Analysis configuration.
+        lemmas: Optional token-to-lemma cache shared across texts.
+
+    Returns:
+        List of preprocessed word tokens.
 
+    Raises:
+        EmptyLyricsError: If text is empty or whitespace only.
+        NLTKResourceError: If NLTK resources are not available.
+    """
     cleaned = clean_lyrics(text)
-    normalized = normalize_text(cleaned, config)
-    tokens = tokenize(normalized, config)
-    # Ensure all tokens are lowercase (safety measure for mixed-language text)
-    tokens = [token.lower() for token in tokens]
-    tokens = lemmatize(tokens, config, text=cleaned)
+
+    # Resolve the language once. Calling normalize_text, tokenize and lemmatize
+    # separately would each scan the whole song again to detect it.
+    language = config.language
+    if language == "auto":
+        language = detect_language(cleaned)
+
+    normalized = normalize_text_for_language(cleaned, language)
+    # Lowercase every token here rather than relying on normalization: the
+    # Japanese path does not lowercase embedded Latin words, and preprocess
+    # guarantees lowercase output for every language.
+    # Tokens are interned: lyrics repeat a small vocabulary heavily, so sharing one
+    # string per word saves memory and speeds up downstream Counter lookups.
+    tokens = [
+        sys.intern(token.lower())
+        for token in _tokenize_for_language(normalized, language, config)
+    ]
+
+    # Japanese is skipped: Janome already returns base forms
+    if config.use_lemmatization and language != "japanese":
+        tokens = _lemmatize_unique(tokens, lemmas)
 
     return tokens
 
@@ -244,30 +434,77 @@ def clean_lyrics_preserve_lines(text: str) -> list[str]:
     if not text or not text.strip():
         raise EmptyLyricsError("Lyrics text is empty or contains only whitespace")
 
-    # Split into lines
+    # Remove section headers in a single pass (skipped when there is no "["),
+    # then split into lines
+    if "[" in text:
+        text = SECTION_HEADER_PATTERN.sub("", text)
     lines = text.split("\n")
 
-    # Clean each line (remove section headers)
+    # Strip each line and only keep non-empty lines
     cleaned_lines: list[str] = []
     for line in lines:
-        cleaned = SECTION_HEADER_PATTERN.sub("", line)
-        cleaned = cleaned.strip()
-        if cleaned:  # Only keep non-empty lines
+        cleaned = line.strip()
+        if cleaned:
             cleaned_lines.append(cleaned)
 
     return cleaned_lines
 
 
-def tokenize_with_positions(
+def _scan_token_columns(lines: list[str], columns: TokenColumns) -> None:
+    """Tokenize cleaned English lines in a single regex pass.
+
+    The lines are joined and scanned once with FAST_TOKEN_PATTERN; each match's
+    line index is recovered from the line end offsets. Each line is NFKC
+    normalized and lowercased before matching, as normalize_text_for_language
+    does: lowercasing can change word boundaries ("İ" lowercases to "i" plus a
+    combining dot, which is not a word character). Stripping punctuation first
+    is not needed, since the pattern only accepts word characters and
+    apostrophes between them.
+
+    Args:
+        lines: Cleaned lyrics lines from clean_lyrics_preserve_lines.
+        columns: Token columns to append to.
+    """
+    # NFKC-normalize and lowercase like normalize_text_for_language; neither
+    # adds newlines, so offsets follow the normalized lines while columns keep
+    # the original lines for context
+    normalized_lines = [
+        line.lower() if line.isascii() else unicodedata.normalize("NFKC", line).lower()
+        for line in lines
+    ]
+
+    # Match offsets only increase, so the line index is found by walking the
+    # line end offsets alongside the matches instead of searching for each one
+    line_ends: list[int] = []
+    offset = 0
+    for line in normalized_lines:
+        offset += len(line) + 1
+        line_ends.append(offset)
+
+    line_index = 0
+    word_index = 0
+    for match in FAST_TOKEN_PATTERN.finditer("\n".join(normalized_lines)):
+        start = match.start()
+        if start >= line_ends[line_index]:
+            while start >= line_ends[line_index]:
+                line_index += 1
+            word_index = 0
+        columns.tokens.append(sys.intern(match.group()))
+        columns.line_indices.append(line_index)
+        columns.word_indices.append(word_index)
+        word_index += 1
+
+
+def tokenize_with_positions_columnar(
     text: str,
     song_id: int,
     song_title: str,
     config: AnalysisConfig | None = None,
-) -> list[TokenWithPosition]:
-    """Tokenize text while preserving line and position information.
+) -> TokenColumns:
+    """Tokenize text into column-oriented tokens with position information.
 
-    This is used for context extraction, where we need to track where each
-    token appears in the original lyrics.
+    Produces the same data as tokenize_with_positions, stored as parallel
+    columns instead of one object per token.
 
     Args:
         text: Raw lyrics text.
@@ -276,66 +513,148 @@ def tokenize_with_positions(
         config: Analysis configuration (uses default if None).
 
     Returns:
-        List of tokens with their position information.
+        Token columns for the song.
 
     Raises:
         EmptyLyricsError: If text is empty or whitespace only.
         NLTKResourceError: If NLTK resources are not available.
     """
     if config is None:
-        from barscan.analyzer.models import AnalysisConfig
-
-        config = AnalysisConfig()
+        config = DEFAULT_CONFIG
 
     # Determine language once for consistency
     language = config.language
     if language == "auto":
         language = detect_language(text)
 
-    if language == "english":
+    use_regex_tokenizer = language == "english" and not config.use_nltk_tokenizer
+    if language == "english" and not use_regex_tokenizer:
         ensure_nltk_resources()
 
     # Get lines while preserving structure
     lines = clean_lyrics_preserve_lines(text)
+    columns = TokenColumns(song_id=song_id, song_title=song_title, lines=lines)
+
+    if use_regex_tokenizer:
+        _scan_token_columns(lines, columns)
+    else:
+        tokenizer = get_tokenizer(language)
+
+        # Normalize each line, then tokenize all lines in one batch
+        # (use POS filtering for Japanese if enabled)
+        normalized_lines = (normalize_text_for_language(line, language) for line in lines)
+        if isinstance(tokenizer, JapaneseTokenizer):
+            token_lists = tokenizer.tokenize_many(
+                normalized_lines, pos_filter=config.use_pos_filtering
+            )
+        else:
+            token_lists = tokenizer.tokenize_many(normalized_lines)
 
-    tokens_with_positions: list[TokenWithPosition] = []
-    tokenizer = get_tokenizer(language)
-
-    for line_index, line in enumerate(lines):
-        # Normalize the line for tokenization
-        normalized_line = normalize_text_for_language(line, language)
-
-        # Tokenize the normalized line (use POS filtering for Japanese if enabled)
         try:
-            if language == "japanese" and config.use_pos_filtering:
-                if isinstance(tokenizer, JapaneseTokenizer):
-                    line_tokens = tokenizer.tokenize_with_pos_filter(normalized_line)
-                else:
-                    line_tokens = tokenizer.tokenize(normalized_line)
-            else:
-                line_tokens = tokenizer.tokenize(normalized_line)
+            for line_index, line_tokens in enumerate(token_lists):
+                # Ensure all tokens are lowercase (safety measure for mixed-language text)
+                columns.tokens.extend(sys.intern(token.lower()) for token in line_tokens)
+                columns.line_indices.extend([line_index] * len(line_tokens))
+                columns.word_indices.extend(range(len(line_tokens)))
         except LookupError as e:
             raise NLTKResourceError(f"Tokenization failed: {e}") from e
 
-        # Ensure all tokens are lowercase (safety measure for mixed-language text)
-        line_tokens = [token.lower() for token in line_tokens]
-
-        # Optionally lemmatize (only for English)
-        if config.use_lemmatization and language == "english":
-            lemmatizer = _get_lemmatizer()
-            line_tokens = [lemmatizer.lemmatize(token) for token in line_tokens]
-
-        # Create TokenWithPosition for each token
-        for word_index, token in enumerate(line_tokens):
-            tokens_with_positions.append(
-                TokenWithPosition(
-                    token=token,
-                    line_index=line_index,
-                    word_index=word_index,
-                    original_line=line,  # Keep original line for context
-                    song_id=song_id,
-                    song_title=song_title,
-                )
-            )
+    # Optionally lemmatize (only for English), once for the whole song
+    if config.use_lemmatization and language == "english":
+        columns.tokens[:] = _lemmatize_unique(columns.tokens)
+
+    return columns
+
+
+def tokenize_with_positions(
+    text: str,
+    song_id: int,
+    song_title: str,
+    config: AnalysisConfig | None = None,
+) -> list[TokenWithPosition]:
+    """Tokenize text while preserving line and position information.
+
+    This is used for context extraction, where we need to track where each
+    token appears in the original lyrics.
+
+    Args:
+        text: Raw lyrics text.
+        song_id: Genius song ID.
+        song_title: Title of the song.
+        config: Analysis configuration (uses default if None).
+
+    Returns:
+        List of tokens with their position information.
+
+    Raises:
+        EmptyLyricsError: If text is empty or whitespace only.
+        NLTKResourceError: If NLTK resources are not available.
+    """
+    return tokenize_with_positions_columnar(text, song_id, song_title, config).to_tokens()
+
+
+def _tokenize_song_with_positions(
+    song: tuple[str, int, str],
+    config: AnalysisConfig,
+) -> list[TokenWithPosition]:
+    """Tokenize a single (lyrics_text, song_id, song_title) tuple for batch processing.
+
+    Module-level so it can be pickled and dispatched to worker processes. Each
+    worker lazily initializes its own tokenizer and lemmatizer on first use.
+
+    Args:
+        song: Tuple of (lyrics_text, song_id, song_title).
+        config: Analysis configuration.
+
+    Returns:
+        List of tokens with position information, or an empty list if the
+        lyrics are empty.
+    """
+    text, song_id, song_title = song
+    try:
+        return tokenize_with_positions(
+            text=text,
+            song_id=song_id,
+            song_title=song_title,
+            config=config,
+        )
+    except EmptyLyricsError:
+        return []
+
+
+def tokenize_with_positions_batch(
+    lyrics_data: Iterable[tuple[str, int, str]],
+    config: AnalysisConfig | None = None,
+    n_workers: int = 1,
+    chunksize: int = 64,
+) -> Iterator[list[TokenWithPosition]]:
+    """Tokenize many songs while preserving line and position information.
+
+    Songs are independent, so with ``n_workers > 1`` they are distributed across
+    a process pool. Results are yielded in input order, one list per song.
+    Songs with empty lyrics yield an empty list.
+
+    Args:
+        lyrics_data: Iterable of (lyrics_text, song_id, song_title) tuples.
+        config: Analysis configuration (uses default if None).
+        n_workers: Number of worker processes. 1 (default) processes songs
+            sequentially in the current process.
+        chunksize: Number of songs sent to a worker per task.
+
+    Yields:
+        List of tokens with position information for each song.
+
+    Raises:
+        NLTKResourceError: If NLTK resources are not available.
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    process_song = partial(_tokenize_song_with_positions, config=config)
+
+    if n_workers <= 1:
+        yield from map(process_song, lyrics_data)
+        return
 
-    return tokens_with_positions
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        yield from executor.map(process_song, lyrics_data, chunksize=chunksize)
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import threading
+
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 
 from barscan.analyzer.nltk_resources import SENTIMENT_RESOURCES, ensure_resources
 from barscan.exceptions import NLTKResourceError
 
-# Singleton instance for performance
+# Singleton instance for performance. SentimentIntensityAnalyzer parses the
+# VADER lexicon file in its constructor, so it must only be built once.
 _sia: SentimentIntensityAnalyzer | None = None
+_sia_lock = threading.Lock()
 
 
 def ensure_sentiment_resources() -> None:
@@ -23,6 +27,9 @@ def ensure_sentiment_resources() -> None:
 def _get_analyzer() -> SentimentIntensityAnalyzer:
     """Get or create the VADER sentiment analyzer.
 
+    The analyzer is created lazily on first use and shared across threads, so
+    concurrent first calls do not each load the lexicon.
+
     Returns:
         SentimentIntensityAnalyzer instance.
 
@@ -31,14 +38,33 @@ def _get_analyzer() -> SentimentIntensityAnalyzer:
     """
     global _sia
     if _sia is None:
-        ensure_sentiment_resources()
-        try:
-            _sia = SentimentIntensityAnalyzer()
-        except LookupError as e:
-            raise NLTKResourceError(f"NLTK VADER initialization failed: {e}") from e
+        with _sia_lock:
+            if _sia is None:
+                ensure_sentiment_resources()
+                try:
+                    _sia = SentimentIntensityAnalyzer()
+                except LookupError as e:
+                    raise NLTKResourceError(f"NLTK VADER initialization failed: {e}") from e
     return _sia
 
 
+def _categorize(compound: float) -> str:
+    """Classify a VADER compound score.
+
+    Args:
+        compound: VADER compound score from -1.0 to 1.0.
+
+    Returns:
+        'positive', 'negative', or 'neutral'.
+    """
+    # Classify based on compound score thresholds
+    if compound >= 0.05:
+        return "positive"
+    if compound <= -0.05:
+        return "negative"
+    return "neutral"
+
+
 def analyze_sentiment(text: str) -> tuple[str, float]:
     """Analyze sentiment of text.
 
@@ -57,15 +83,7 @@ def analyze_sentiment(text: str) -> tuple[str, float]:
     scores = sia.polarity_scores(text)
     compound = scores["compound"]
 
-    # Classify based on compound score thresholds
-    if compound >= 0.05:
-        category = "positive"
-    elif compound <= -0.05:
-        category = "negative"
-    else:
-        category = "neutral"
-
-    return (category, round(compound, 4))
+    return (_categorize(compound), round(compound, 4))
 
 
 def analyze_word_sentiment(word: str) -> tuple[str, float]:
@@ -89,6 +107,9 @@ def analyze_word_sentiment(word: str) -> tuple[str, float]:
 def get_sentiment_scores(words: list[str]) -> dict[str, tuple[str, float]]:
     """Get sentiment scores for a list of words.
 
+    Words are deduplicated case-insensitively. Only words found in the VADER
+    lexicon (or containing non-letters) go through full VADER scoring.
+
     Args:
         words: List of words to analyze.
 
@@ -101,10 +122,14 @@ def get_sentiment_scores(words: list[str]) -> dict[str, tuple[str, float]]:
     if not words:
         return {}
 
+    lexicon = _get_analyzer().lexicon
     result: dict[str, tuple[str, float]] = {}
-    for word in set(words):  # Deduplicate
-        word_lower = word.lower()
-        if word_lower not in result:
+    for word_lower in {word.lower() for word in words}:  # Deduplicate
+        if word_lower.isalpha() and word_lower not in lexicon:
+            # A single alphabetic word outside the VADER lexicon always scores 0,
+            # so skip the full polarity_scores pipeline for it
+            result[word_lower] = ("neutral", 0.0)
+        else:
             result[word_lower] = analyze_word_sentiment(word_lower)
 
     return result
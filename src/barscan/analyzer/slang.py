@@ -181,6 +181,23 @@ SLANG_WORDS: frozenset[str] = frozenset(
 )
 
 
+def _get_slang_set(additional_slang: frozenset[str] | None) -> frozenset[str]:
+    """Get the slang set to check against.
+
+    Returns SLANG_WORDS itself when there is no additional slang, so the
+    common case does not build a new set on every call.
+
+    Args:
+        additional_slang: Optional additional slang words to include.
+
+    Returns:
+        Frozen set of slang words.
+    """
+    if not additional_slang:
+        return SLANG_WORDS
+    return SLANG_WORDS | additional_slang
+
+
 def is_slang(word: str, additional_slang: frozenset[str] | None = None) -> bool:
     """Check if a word is slang.
 
@@ -191,9 +208,7 @@ def is_slang(word: str, additional_slang: frozenset[str] | None = None) -> bool:
     Returns:
         True if the word is in the slang dictionary.
     """
-    word_lower = word.lower()
-    slang_set = SLANG_WORDS | (additional_slang or frozenset())
-    return word_lower in slang_set
+    return word.lower() in _get_slang_set(additional_slang)
 
 
 def detect_slang_words(
@@ -212,15 +227,9 @@ def detect_slang_words(
     if not words:
         return {}
 
-    slang_set = SLANG_WORDS | (additional_slang or frozenset())
-    result: dict[str, bool] = {}
-
-    for word in set(words):  # Deduplicate
-        word_lower = word.lower()
-        if word_lower not in result:
-            result[word_lower] = word_lower in slang_set
-
-    return result
+    slang_set = _get_slang_set(additional_slang)
+    # Deduplicate case-insensitively, then check each unique word once
+    return {word_lower: word_lower in slang_set for word_lower in set(map(str.lower, words))}
 
 
 def get_slang_count(
@@ -236,5 +245,5 @@ def get_slang_count(
     Returns:
         Number of slang word occurrences.
     """
-    slang_set = SLANG_WORDS | (additional_slang or frozenset())
-    return sum(1 for word in words if word.lower() in slang_set)
+    slang_set = _get_slang_set(additional_slang)
+    return sum(map(slang_set.__contains__, map(str.lower, words)))
@@ -25,9 +25,10 @@ def calculate_document_frequencies(
     """
     doc_freq: Counter[str] = Counter()
     for word_counts in word_counts_per_song:
-        # Each word counts once per document, regardless of frequency
-        for word in word_counts:
-            doc_freq[word] += 1
+        # Each word counts once per document, regardless of frequency.
+        # Passing the keys view (not the mapping) makes update() add 1 per key
+        # in C instead of summing the per-song counts.
+        doc_freq.update(word_counts.keys())
     return dict(doc_freq)
 
 
@@ -91,13 +92,24 @@ def calculate_tfidf_scores(
     if not word_counts:
         return {}
 
+    if total_words == 0 or total_documents == 0:
+        return dict.fromkeys(word_counts, 0.0)
+
+    # Inline calculate_tf/calculate_idf: the zero checks above hold for every
+    # word, so the loop body is just lookups and float ops. IDF depends only on
+    # the document frequency, which takes at most total_documents distinct
+    # values (mostly 1 for lyrics), so each log is computed once per value.
+    log = math.log
+    get_doc_freq = document_frequencies.get
+    idf_by_doc_freq: dict[int, float] = {0: 0.0}
+    get_idf = idf_by_doc_freq.get
     tfidf_scores: dict[str, float] = {}
-
     for word, count in word_counts.items():
-        tf = calculate_tf(count, total_words)
-        doc_freq = document_frequencies.get(word, 0)
-        idf = calculate_idf(doc_freq, total_documents)
-        tfidf_scores[word] = tf * idf
+        doc_freq = get_doc_freq(word, 0)
+        idf = get_idf(doc_freq)
+        if idf is None:
+            idf = idf_by_doc_freq[doc_freq] = log(total_documents / doc_freq)
+        tfidf_scores[word] = count / total_words * idf
 
     if normalize and tfidf_scores:
         max_score = max(tfidf_scores.values())
@@ -111,8 +123,8 @@ def calculate_tfidf_scores(
 
 def calculate_corpus_tfidf(
     word_counts_per_song: list[Counter[str]],
-    aggregate_counts: dict[str, int],
-    total_words: int,
+    aggregate_counts: dict[str, int] | None = None,
+    total_words: int | None = None,
     normalize: bool = True,
 ) -> dict[str, float]:
     """Calculate TF-IDF scores for an aggregated corpus.
@@ -124,8 +136,12 @@ def calculate_corpus_tfidf(
 
     Args:
         word_counts_per_song: List of Counter objects, one per song.
-        aggregate_counts: Aggregated word counts across all songs.
-        total_words: Total words in the entire corpus.
+        aggregate_counts: Aggregated word counts across all songs. If None,
+            computed in one pass over the per-song counts, which is
+            O(songs x unique words per song). Avoid building it with
+            sum(counters, Counter()), which copies the running total per song.
+        total_words: Total words in the entire corpus. If None, the sum of
+            aggregate_counts.
         normalize: Whether to normalize scores to 0.0-1.0 range.
 
     Returns:
@@ -135,6 +151,14 @@ def calculate_corpus_tfidf(
     if total_documents == 0:
         return {}
 
+    if aggregate_counts is None:
+        aggregate: Counter[str] = Counter()
+        for word_counts in word_counts_per_song:
+            aggregate.update(word_counts)
+        aggregate_counts = aggregate
+    if total_words is None:
+        total_words = sum(aggregate_counts.values())
+
     doc_frequencies = calculate_document_frequencies(word_counts_per_song)
 
     return calculate_tfidf_scores(
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import re
+import threading
 import unicodedata
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any, Final
 
 from nltk.tokenize import word_tokenize
 
@@ -16,6 +19,23 @@ KANJI_RANGE = (0x4E00, 0x9FFF)
 KATAKANA_EXTENDED_RANGE = (0x31F0, 0x31FF)
 HALFWIDTH_KATAKANA_RANGE = (0xFF65, 0xFF9F)
 
+# Character class covering every range above, so whole texts can be scanned
+# for Japanese characters by the regex engine instead of a per-character loop
+JAPANESE_CHAR_PATTERN: Final[re.Pattern[str]] = re.compile(
+    "["
+    + "".join(
+        f"{chr(start)}-{chr(end)}"
+        for start, end in (
+            HIRAGANA_RANGE,
+            KATAKANA_RANGE,
+            KANJI_RANGE,
+            KATAKANA_EXTENDED_RANGE,
+            HALFWIDTH_KATAKANA_RANGE,
+        )
+    )
+    + "]"
+)
+
 # Part-of-speech categories to keep for Japanese content word analysis
 # Keeps: nouns, verbs, adjectives, adverbs, interjections
 # Removes: particles (が, を, に), auxiliaries (た, て, ない)
@@ -27,6 +47,53 @@ MEANINGFUL_POS = frozenset({"名詞", "動詞", "形容詞", "副詞", "感動
 EXCLUDED_POS2 = frozenset({"非自立", "接尾"})
 
 
+# Pattern to match non-word characters (except apostrophes for contractions)
+ENGLISH_PUNCTUATION_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^\w\s']")
+
+# Pattern to match apostrophes that are not between two word characters
+STANDALONE_APOSTROPHE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?<!\w)'|'(?!\w)")
+
+# Pattern to match common ASCII punctuation (Japanese-specific punctuation is kept)
+JAPANESE_PUNCTUATION_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[!\"#$%&'()*+,\-./:;<=>?@\[\]^_`{|}~]"
+)
+
+
+def _build_ascii_punctuation_table() -> bytes:
+    """Build a bytes.translate table mapping ASCII punctuation to spaces.
+
+    Covers exactly the ASCII characters matched by ENGLISH_PUNCTUATION_PATTERN,
+    so the table can replace that regex for ASCII text.
+
+    Returns:
+        A 256-byte translation table.
+    """
+    return bytes(
+        0x20 if code < 0x80 and ENGLISH_PUNCTUATION_PATTERN.match(chr(code)) else code
+        for code in range(256)
+    )
+
+
+# Translation table for the ASCII fast path of English normalization
+ASCII_PUNCTUATION_TABLE: Final[bytes] = _build_ascii_punctuation_table()
+
+
+@lru_cache(maxsize=4096)
+def _word_tokenize_cached(text: str) -> tuple[str, ...]:
+    """Tokenize English text with NLTK word_tokenize, memoized by input text.
+
+    Lyrics repeat lines (choruses, hooks) heavily, so the same normalized
+    string is tokenized many times. Results are cached as immutable tuples.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        A tuple of tokens.
+    """
+    return tuple(word_tokenize(text))
+
+
 def is_japanese_char(char: str) -> bool:
     """Check if a character is Japanese (Hiragana, Katakana, or Kanji).
 
@@ -58,7 +125,11 @@ def is_japanese_text(text: str) -> bool:
     Returns:
         True if the text contains Japanese characters, False otherwise.
     """
-    return any(is_japanese_char(char) for char in text)
+    # str.isascii() reads a flag CPython stores on every string, so ASCII-only
+    # text (most English lyrics) is rejected without scanning it
+    if text.isascii():
+        return False
+    return JAPANESE_CHAR_PATTERN.search(text) is not None
 
 
 def detect_language(text: str) -> str:
@@ -76,15 +147,47 @@ def detect_language(text: str) -> str:
 
     # If there are any Japanese characters, treat as Japanese
     # (Japanese text often mixes with English words)
-    if any(is_japanese_char(char) for char in text):
+    if is_japanese_text(text):
         return "japanese"
 
     return "english"
 
 
+# Process-wide Janome tokenizer. Loading its system dictionary is the
+# expensive part, so every JapaneseTokenizer instance shares one.
+_janome_tokenizer: Any = None
+_janome_tokenizer_lock = threading.Lock()
+
+
+def _get_janome_tokenizer() -> Any:
+    """Get or create the shared Janome tokenizer.
+
+    Returns:
+        janome.tokenizer.Tokenizer instance.
+
+    Raises:
+        ImportError: If Janome is not installed.
+    """
+    global _janome_tokenizer
+    if _janome_tokenizer is None:
+        with _janome_tokenizer_lock:
+            if _janome_tokenizer is None:
+                try:
+                    from janome.tokenizer import Tokenizer as JanomeTokenizer
+                except ImportError as e:
+                    raise ImportError(
+                        "Janome is required for Japanese tokenization. "
+                        "Install it with: pip install barscan[japanese]"
+                    ) from e
+                _janome_tokenizer = JanomeTokenizer()
+    return _janome_tokenizer
+
+
 class Tokenizer(ABC):
     """Abstract base class for tokenizers."""
 
+    __slots__ = ()
+
     @abstractmethod
     def tokenize(self, text: str) -> list[str]:
         """Tokenize text into a list of tokens.
@@ -109,21 +212,38 @@ class Tokenizer(ABC):
         """
         pass
 
+    def tokenize_many(self, texts: Iterable[str]) -> Iterator[list[str]]:
+        """Tokenize several texts, e.g. the lines of a song.
+
+        Subclasses override this to do per-batch setup once instead of per text.
+
+        Args:
+            texts: The texts to tokenize.
+
+        Yields:
+            A list of tokens for each text, in input order.
+        """
+        for text in texts:
+            yield self.tokenize(text)
+
 
 class EnglishTokenizer(Tokenizer):
     """Tokenizer for English text using NLTK."""
 
+    __slots__ = ()
+
     def tokenize(self, text: str) -> list[str]:
         """Tokenize English text using NLTK word_tokenize.
 
+        Results for repeated inputs are served from an LRU cache.
+
         Args:
             text: The text to tokenize.
 
         Returns:
             A list of tokens.
         """
-        tokens: list[str] = word_tokenize(text)
-        return tokens
+        return list(_word_tokenize_cached(text))
 
     def get_base_forms(self, text: str) -> list[str]:
         """Tokenize and return tokens (lemmatization handled separately).
@@ -140,22 +260,16 @@ class EnglishTokenizer(Tokenizer):
 class JapaneseTokenizer(Tokenizer):
     """Tokenizer for Japanese text using Janome."""
 
+    __slots__ = ("_tokenizer",)
+
     def __init__(self) -> None:
         """Initialize the Japanese tokenizer."""
         self._tokenizer: Any = None
 
     def _get_tokenizer(self) -> Any:
-        """Lazy initialization of Janome tokenizer."""
+        """Lazy initialization of Janome tokenizer (shared across instances)."""
         if self._tokenizer is None:
-            try:
-                from janome.tokenizer import Tokenizer as JanomeTokenizer
-
-                self._tokenizer = JanomeTokenizer()
-            except ImportError as e:
-                raise ImportError(
-                    "Janome is required for Japanese tokenization. "
-                    "Install it with: pip install barscan[japanese]"
-                ) from e
+            self._tokenizer = _get_janome_tokenizer()
         return self._tokenizer
 
     def tokenize(self, text: str) -> list[str]:
@@ -181,16 +295,21 @@ class JapaneseTokenizer(Tokenizer):
         Returns:
             A list of base form tokens.
         """
-        tokenizer = self._get_tokenizer()
-        tokens = []
-        for token in tokenizer.tokenize(text):
-            # Use base form if available, otherwise use surface form
-            base_form = token.base_form
-            if base_form == "*":
-                tokens.append(token.surface)
-            else:
-                tokens.append(base_form)
-        return tokens
+        return list(self.iter_base_forms(text))
+
+    def iter_base_forms(self, text: str) -> Iterator[str]:
+        """Tokenize Japanese text and lazily yield base forms.
+
+        Use this instead of get_base_forms when the tokens are consumed once,
+        e.g. by Counter, to avoid building an intermediate list.
+
+        Args:
+            text: The text to tokenize.
+
+        Yields:
+            Base form tokens.
+        """
+        return self._iter_base_forms(self._get_tokenizer().tokenize(text))
 
     def tokenize_with_pos_filter(self, text: str) -> list[str]:
         """Tokenize Japanese text and filter by part-of-speech.
@@ -205,33 +324,87 @@ class JapaneseTokenizer(Tokenizer):
         Returns:
             A list of base form tokens for content words only.
         """
+        return list(self.iter_tokens_with_pos_filter(text))
+
+    def iter_tokens_with_pos_filter(self, text: str) -> Iterator[str]:
+        """Tokenize Japanese text and lazily yield content words.
+
+        Streaming counterpart of tokenize_with_pos_filter.
+
+        Args:
+            text: The text to tokenize.
+
+        Yields:
+            Base form tokens for content words only.
+        """
+        return self._iter_content_words(self._get_tokenizer().tokenize(text))
+
+    def tokenize_many(
+        self, texts: Iterable[str], *, pos_filter: bool = False
+    ) -> Iterator[list[str]]:
+        """Tokenize several Japanese texts with one Janome tokenizer lookup.
+
+        Args:
+            texts: The texts to tokenize.
+            pos_filter: Whether to keep content words only, as in
+                tokenize_with_pos_filter.
+
+        Yields:
+            A list of base form tokens for each text, in input order.
+        """
         tokenizer = self._get_tokenizer()
-        tokens = []
-        for token in tokenizer.tokenize(text):
-            # Parse POS tag (e.g., "動詞,自立,*,*" or "動詞,非自立,*,*")
-            parts = token.part_of_speech.split(",")
-            pos1 = parts[0]  # Primary POS: 動詞, 名詞, etc.
-            pos2 = parts[1] if len(parts) > 1 else "*"  # Secondary: 自立, 非自立, etc.
+        convert = self._iter_content_words if pos_filter else self._iter_base_forms
+        for text in texts:
+            yield list(convert(tokenizer.tokenize(text)))
+
+    @staticmethod
+    def _iter_base_forms(janome_tokens: Iterable[Any]) -> Iterator[str]:
+        """Yield the base form of each Janome token.
+
+        Args:
+            janome_tokens: Tokens produced by Janome.
+
+        Yields:
+            Base form tokens.
+        """
+        for token in janome_tokens:
+            # Use base form if available, otherwise use surface form
+            base_form = token.base_form
+            yield token.surface if base_form == "*" else base_form
+
+    @staticmethod
+    def _iter_content_words(janome_tokens: Iterable[Any]) -> Iterator[str]:
+        """Yield base forms of the Janome tokens that are content words.
+
+        Args:
+            janome_tokens: Tokens produced by Janome.
+
+        Yields:
+            Base form tokens for content words only.
+        """
+        for token in janome_tokens:
+            # Parse POS tag (e.g., "動詞,自立,*,*" or "動詞,非自立,*,*").
+            # partition only splits off the fields needed, and pos2 is only
+            # parsed for tokens that pass the pos1 check.
+            pos1, _, rest = token.part_of_speech.partition(",")  # 動詞, 名詞, etc.
 
             # Skip if not a meaningful primary POS
             if pos1 not in MEANINGFUL_POS:
                 continue
 
             # Skip non-independent forms (てる, いる) and suffixes (さん, 様)
-            if pos2 in EXCLUDED_POS2:
+            if rest.partition(",")[0] in EXCLUDED_POS2:  # 自立, 非自立, etc.
                 continue
 
             base_form = token.base_form
-            if base_form == "*":
-                tokens.append(token.surface)
-            else:
-                tokens.append(base_form)
-        return tokens
+            yield token.surface if base_form == "*" else base_form
 
 
 def normalize_text_for_language(text: str, language: str) -> str:
     """Normalize text based on language.
 
+    NFKC normalization is applied first for every language.
+
     Args:
         text: The text to normalize.
         language: The language ('english', 'japanese', or 'auto').
@@ -242,28 +415,48 @@ def normalize_text_for_language(text: str, language: str) -> str:
     if language == "auto":
         language = detect_language(text)
 
-    if language == "japanese":
-        # NFKC normalization for Japanese
-        # Converts full-width characters to half-width, normalizes unicode
+    # NFKC normalization for all languages, in a single C-level pass.
+    # Converts full-width characters to half-width, folds compatibility forms
+    # (ligatures, superscripts), and normalizes unicode. ASCII is NFKC-invariant.
+    if not text.isascii():
         text = unicodedata.normalize("NFKC", text)
+
+    if language == "japanese":
         # Remove common punctuation but keep Japanese-specific punctuation
-        text = re.sub(r"[!\"#$%&'()*+,\-./:;<=>?@\[\]^_`{|}~]", " ", text)
+        text = JAPANESE_PUNCTUATION_PATTERN.sub(" ", text)
         # Normalize whitespace
         text = " ".join(text.split())
+    elif text.isascii():
+        # English normalization, ASCII fast path: lowercase and strip punctuation
+        # with bytes operations, which avoid per-codepoint str handling
+        text = text.encode("ascii").lower().translate(ASCII_PUNCTUATION_TABLE).decode("ascii")
+        if "'" in text:
+            text = STANDALONE_APOSTROPHE_PATTERN.sub(" ", text)
+        text = " ".join(text.split())
     else:
         # English normalization
         text = text.lower()
         # Remove punctuation except apostrophes in contractions
-        text = re.sub(r"[^\w\s']", " ", text)
-        text = re.sub(r"(?<!\w)'|'(?!\w)", " ", text)
+        text = ENGLISH_PUNCTUATION_PATTERN.sub(" ", text)
+        if "'" in text:
+            text = STANDALONE_APOSTROPHE_PATTERN.sub(" ", text)
         text = " ".join(text.split())
 
     return text
 
 
+# Shared tokenizer instances returned by get_tokenizer. Neither holds
+# per-text state: EnglishTokenizer is stateless and JapaneseTokenizer only
+# caches the shared Janome tokenizer.
+_ENGLISH_TOKENIZER: Final[EnglishTokenizer] = EnglishTokenizer()
+_JAPANESE_TOKENIZER: Final[JapaneseTokenizer] = JapaneseTokenizer()
+
+
 def get_tokenizer(language: str, text: str | None = None) -> Tokenizer:
     """Factory function to get the appropriate tokenizer.
 
+    Returns a shared instance per language rather than a new one per call.
+
     Args:
         language: The language ('english', 'japanese', or 'auto').
         text: Optional text for language detection when language is 'auto'.
@@ -273,10 +466,10 @@ def get_tokenizer(language: str, text: str | None = None) -> Tokenizer:
     """
     if language == "auto":
         if text is None:
-            return EnglishTokenizer()
+            return _ENGLISH_TOKENIZER
         language = detect_language(text)
 
     if language == "japanese":
-        return JapaneseTokenizer()
+        return _JAPANESE_TOKENIZER
 
-    return EnglishTokenizer()
+    return _ENGLISH_TOKENIZER
@@ -44,6 +44,8 @@ class Lyrics(BaseModel):
         description="Timestamp when lyrics were fetched",
     )
 
+    model_config = {"frozen": True}
+
     @property
     def word_count(self) -> int:
         """Return approximate word count of lyrics."""
@@ -1,14 +1,18 @@
 """Tests for analyzer models."""
 
+from array import array
 from datetime import UTC, datetime
 
 import pytest
 from pydantic import ValidationError
 
 from barscan.analyzer.models import (
+    DEFAULT_CONFIG,
     AggregateAnalysisResult,
     AnalysisConfig,
     AnalysisResult,
+    TokenColumns,
+    TokenWithPosition,
     WordFrequency,
 )
 
@@ -62,6 +66,11 @@ class TestAnalysisConfig:
         assert config.custom_stop_words == frozenset()
         assert config.language == "auto"
         assert config.use_pos_filtering is True
+        assert config.use_nltk_tokenizer is False
+
+    def test_shared_default_config(self) -> None:
+        """Test that the shared default matches a freshly constructed config."""
+        assert DEFAULT_CONFIG == AnalysisConfig()
 
     def test_custom_config(self) -> None:
         """Test creating config with custom values."""
@@ -220,3 +229,51 @@ class TestAggregateAnalysisResult:
         )
         with pytest.raises(ValidationError):
             result.artist_name = "New Artist"  # type: ignore[misc]
+
+
+class TestTokenColumns:
+    """Tests for TokenColumns model."""
+
+    def test_empty_columns(self) -> None:
+        """Test that new columns are empty."""
+        columns = TokenColumns(song_id=1, song_title="Test")
+        assert len(columns) == 0
+        assert columns.to_tokens() == []
+
+    def test_to_tokens(self) -> None:
+        """Test converting columns to TokenWithPosition rows."""
+        columns = TokenColumns(
+            song_id=1,
+            song_title="Test",
+            tokens=["hello", "world", "bye"],
+            line_indices=array("I", [0, 0, 1]),
+            word_indices=array("I", [0, 1, 0]),
+            lines=["Hello world", "Bye"],
+        )
+        assert len(columns) == 3
+        assert columns.to_tokens() == [
+            TokenWithPosition(
+                token="hello",
+                line_index=0,
+                word_index=0,
+                original_line="Hello world",
+                song_id=1,
+                song_title="Test",
+            ),
+            TokenWithPosition(
+                token="world",
+                line_index=0,
+                word_index=1,
+                original_line="Hello world",
+                song_id=1,
+                song_title="Test",
+            ),
+            TokenWithPosition(
+                token="bye",
+                line_index=1,
+                word_index=0,
+                original_line="Bye",
+                song_id=1,
+                song_title="Test",
+            ),
+        ]
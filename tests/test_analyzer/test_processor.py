@@ -4,16 +4,22 @@ from unittest.mock import patch
 
 import pytest
 
-from barscan.analyzer.models import AnalysisConfig
+from barscan.analyzer.models import AnalysisConfig, TokenWithPosition
 from barscan.analyzer.processor import (
+    _get_lemmatizer,
     clean_lyrics,
     clean_lyrics_preserve_lines,
     ensure_nltk_resources,
+    has_section_headers,
     lemmatize,
+    lemmatize_many,
     normalize_text,
     preprocess,
+    preprocess_many,
     tokenize,
     tokenize_with_positions,
+    tokenize_with_positions_batch,
+    tokenize_with_positions_columnar,
 )
 from barscan.exceptions import EmptyLyricsError, NLTKResourceError
 
@@ -63,6 +69,31 @@ class TestCleanLyrics:
         assert "  " not in result
         assert "\n" not in result
 
+    def test_header_between_words_leaves_single_space(self) -> None:
+        """Test that removing an inline header does not leave double spaces."""
+        assert clean_lyrics("one [Chorus] two") == "one two"
+        assert clean_lyrics("one[Chorus]two") == "onetwo"
+
+    def test_skips_regex_without_brackets(self) -> None:
+        """Test that text without "[" does not run the header regex."""
+        with patch("barscan.analyzer.processor.SECTION_HEADER_PATTERN") as mock_pattern:
+            result = clean_lyrics("Hello   world")
+        assert result == "Hello world"
+        mock_pattern.sub.assert_not_called()
+
+    def test_removes_headers_with_artist_credits(self) -> None:
+        """Test removing headers with punctuation and non-ASCII artist names."""
+        text = "[Verse 1: Kendrick Lamar & SZA]\nFirst\n[Chorus: Beyonc\u00e9]\nSecond"
+        assert clean_lyrics(text) == "First Second"
+
+    def test_header_does_not_span_lines(self) -> None:
+        """Test that brackets split across lines are not treated as a header."""
+        assert clean_lyrics("[Verse\n1] Hello") == "[Verse 1] Hello"
+
+    def test_lowercase_headers_removed(self) -> None:
+        """Test that lowercase headers are removed."""
+        assert clean_lyrics("[verse 1]\nhello") == "hello"
+
     def test_empty_text_raises_error(self) -> None:
         """Test that empty text raises EmptyLyricsError."""
         with pytest.raises(EmptyLyricsError):
@@ -80,6 +111,24 @@ class TestCleanLyrics:
         assert "hello universe" in result
 
 
+class TestHasSectionHeaders:
+    """Tests for has_section_headers function."""
+
+    def test_detects_headers(self, sample_lyrics_text: str) -> None:
+        """Test that section headers are detected."""
+        assert has_section_headers(sample_lyrics_text)
+        assert has_section_headers("Intro line [Pre-Chorus: Artist] more")
+
+    def test_no_headers(self, cleaned_lyrics_text: str) -> None:
+        """Test text without headers."""
+        assert not has_section_headers(cleaned_lyrics_text)
+        assert not has_section_headers("")
+
+    def test_cleaned_lyrics_have_no_headers(self, sample_lyrics_text: str) -> None:
+        """Test that clean_lyrics output has no remaining headers."""
+        assert not has_section_headers(clean_lyrics(sample_lyrics_text))
+
+
 class TestNormalizeText:
     """Tests for normalize_text function."""
 
@@ -137,11 +186,43 @@ class TestTokenize:
         # NLTK splits contractions
         assert "do" in result or "don't" in result
 
+    def test_nltk_tokenizer_splits_contractions(self) -> None:
+        """Test that the NLTK tokenizer can be selected."""
+        config = AnalysisConfig(language="english", use_nltk_tokenizer=True)
+        result = tokenize("don't", config)
+        assert result == ["do", "n't"]
+
     def test_empty_string(self) -> None:
         """Test tokenizing empty string."""
         result = tokenize("")
         assert result == []
 
+    def test_regex_tokenizer(self) -> None:
+        """Test the default regex tokenizer keeps contractions whole."""
+        config = AnalysisConfig(language="english")
+        result = tokenize("hello world don't y'all", config)
+        assert result == ["hello", "world", "don't", "y'all"]
+
+    def test_regex_tokenizer_keeps_informal_contractions(self) -> None:
+        """Test the default tokenizer keeps slang contractions and clitics whole."""
+        config = AnalysisConfig(language="english")
+        result = tokenize("gonna wanna gotta cannot don't it's", config)
+        assert result == ["gonna", "wanna", "gotta", "cannot", "don't", "it's"]
+
+    def test_nltk_tokenizer_restores_treebank_splits(self) -> None:
+        """Test use_nltk_tokenizer restores NLTK's splits of the same contractions."""
+        config = AnalysisConfig(language="english", use_nltk_tokenizer=True)
+        result = tokenize("gonna wanna gotta cannot don't it's", config)
+        expected = ["gon", "na", "wan", "na", "got", "ta", "can", "not", "do", "n't", "it", "'s"]
+        assert result == expected
+
+    def test_regex_tokenizer_skips_nltk(self) -> None:
+        """Test the regex tokenizer does not touch NLTK resources."""
+        config = AnalysisConfig(language="english")
+        with patch("barscan.analyzer.processor.ensure_nltk_resources") as mock_ensure:
+            tokenize("hello world", config)
+        mock_ensure.assert_not_called()
+
 
 class TestLemmatize:
     """Tests for lemmatize function."""
@@ -160,6 +241,18 @@ class TestLemmatize:
         assert "cat" in result or "cats" in result  # cats -> cat
         assert len(result) == 3
 
+    def test_lemmatization_looks_up_unique_tokens_once(
+        self, config_with_lemmatization: AnalysisConfig
+    ) -> None:
+        """Test that repeated tokens are lemmatized only once."""
+        tokens = ["cats", "dogs", "cats", "cats", "dogs"]
+        with patch("barscan.analyzer.processor._get_lemmatizer") as mock_get:
+            mock_get.return_value.lemmatize.side_effect = lambda w: w.rstrip("s")
+            result = lemmatize(tokens, config_with_lemmatization)
+
+        assert result == ["cat", "dog", "cat", "cat", "dog"]
+        assert mock_get.return_value.lemmatize.call_count == 2
+
     def test_lemmatization_with_none_config(self) -> None:
         """Test lemmatization with None config uses default."""
         tokens = ["hello", "world"]
@@ -167,6 +260,39 @@ class TestLemmatize:
         assert result == tokens
 
 
+class TestLemmatizeMany:
+    """Tests for lemmatize_many function."""
+
+    def test_lemmatization_disabled_by_default(self) -> None:
+        """Test that token lists are returned unchanged by default."""
+        token_lists = [["running", "cats"], ["better"]]
+        assert lemmatize_many(token_lists) == token_lists
+
+    def test_skips_japanese(self) -> None:
+        """Test that Japanese token lists are returned unchanged."""
+        config = AnalysisConfig(use_lemmatization=True, language="japanese")
+        token_lists = [["猫", "走る"]]
+        assert lemmatize_many(token_lists, config) == token_lists
+
+    def test_shares_lookups_across_lists(
+        self, config_with_lemmatization: AnalysisConfig
+    ) -> None:
+        """Test that a token repeated across lists is lemmatized only once."""
+        token_lists = [["cats", "dogs"], ["cats", "birds"], ["dogs"]]
+        with patch("barscan.analyzer.processor._get_lemmatizer") as mock_get:
+            mock_get.return_value.lemmatize.side_effect = lambda w: w.rstrip("s")
+            result = lemmatize_many(token_lists, config_with_lemmatization)
+
+        assert result == [["cat", "dog"], ["cat", "bird"], ["dog"]]
+        assert mock_get.return_value.lemmatize.call_count == 3
+
+    def test_matches_lemmatize(self, config_with_lemmatization: AnalysisConfig) -> None:
+        """Test that results match lemmatizing each list separately."""
+        token_lists = [["running", "cats", "better"], ["cats", "geese"]]
+        result = lemmatize_many(token_lists, config_with_lemmatization)
+        assert result == [lemmatize(tokens, config_with_lemmatization) for tokens in token_lists]
+
+
 class TestPreprocess:
     """Tests for preprocess function."""
 
@@ -200,6 +326,57 @@ class TestPreprocess:
         assert "hello" in result
         assert "world" in result
 
+    def test_matches_step_by_step_pipeline(self, sample_lyrics_text: str) -> None:
+        """Test that preprocess matches running each step separately."""
+        config = AnalysisConfig(use_lemmatization=True)
+        cleaned = clean_lyrics(sample_lyrics_text)
+        tokens = tokenize(normalize_text(cleaned, config), config)
+        expected = lemmatize([token.lower() for token in tokens], config, text=cleaned)
+        assert preprocess(sample_lyrics_text, config) == expected
+
+    def test_detects_language_once(self, sample_lyrics_text: str) -> None:
+        """Test that auto language detection scans the lyrics only once."""
+        with patch(
+            "barscan.analyzer.processor.detect_language", return_value="english"
+        ) as mock_detect:
+            preprocess(sample_lyrics_text, AnalysisConfig(use_lemmatization=True))
+
+        mock_detect.assert_called_once()
+
+
+class TestPreprocessMany:
+    """Tests for preprocess_many function."""
+
+    def test_matches_preprocess(self, sample_lyrics_text: str) -> None:
+        """Test that each result matches preprocessing the text alone."""
+        config = AnalysisConfig(use_lemmatization=True)
+        texts = [sample_lyrics_text, "Cats and dogs\nRunning cats"]
+        result = list(preprocess_many(texts, config))
+        assert result == [preprocess(text, config) for text in texts]
+
+    def test_shares_lemma_lookups(self) -> None:
+        """Test that a token repeated across texts is lemmatized only once."""
+        config = AnalysisConfig(use_lemmatization=True, language="english")
+        texts = ["cats dogs", "cats birds", "dogs"]
+        with patch("barscan.analyzer.processor._get_lemmatizer") as mock_get:
+            mock_get.return_value.lemmatize.side_effect = lambda w: w.rstrip("s")
+            result = list(preprocess_many(texts, config))
+
+        assert result == [["cat", "dog"], ["cat", "bird"], ["dog"]]
+        assert mock_get.return_value.lemmatize.call_count == 3
+
+    def test_empty_text_raises_error(self) -> None:
+        """Test that an empty text raises EmptyLyricsError."""
+        with pytest.raises(EmptyLyricsError):
+            list(preprocess_many(["Hello world", "   "]))
+
+    def test_process_pool_matches_sequential(self, sample_lyrics_text: str) -> None:
+        """Test that parallel preprocessing yields the same results in order."""
+        texts = [sample_lyrics_text, "Cats and dogs\nRunning cats", "Hello world"]
+        sequential = list(preprocess_many(texts))
+        parallel = list(preprocess_many(texts, n_workers=2, chunksize=1))
+        assert parallel == sequential
+
 
 class TestProcessorEdgeCases:
     """Additional edge case tests for processor functions."""
@@ -280,6 +457,11 @@ class TestProcessorEdgeCases:
         assert result.count("yeah") == 3 or "yeah" in result
         assert result.count("baby") == 2 or "baby" in result
 
+    def test_preprocess_interns_tokens(self) -> None:
+        """Test that repeated tokens share a single interned string."""
+        result = preprocess("[Hook]\nYeah YEAH yeah")
+        assert result[0] is result[1] is result[2]
+
     def test_preprocess_normalizes_mixed_case_to_lowercase(self) -> None:
         """Test that mixed-case words are normalized to lowercase."""
         text = "[Hook]\nYeah YEAH yeah Wavy WAVY"
@@ -300,6 +482,12 @@ class TestProcessorEdgeCases:
         assert "Actual lyrics" in result
         assert "[By Artist]" not in result
 
+    def test_normalize_text_applies_nfkc(self) -> None:
+        """Test that compatibility characters are folded for English text."""
+        config = AnalysisConfig(language="english")
+        result = normalize_text("\uff28\uff49 \ufb01re", config)
+        assert result == "hi fire"
+
     def test_normalize_preserves_possessive_apostrophe(self) -> None:
         """Test that possessive apostrophes are preserved."""
         text = "Sarah's guitar john's bass"
@@ -317,6 +505,11 @@ class TestProcessorEdgeCases:
 class TestEnsureNltkResources:
     """Tests for ensure_nltk_resources function."""
 
+    @pytest.fixture(autouse=True)
+    def reset_ready_flag(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Force the one-shot resource check to run for each test."""
+        monkeypatch.setattr("barscan.analyzer.processor._nltk_resources_ready", False)
+
     @patch("nltk.data.find")
     def test_resources_already_present(self, mock_find: patch) -> None:
         """Test when all resources are already downloaded."""
@@ -345,6 +538,51 @@ class TestEnsureNltkResources:
         with pytest.raises(NLTKResourceError, match="Failed to download"):
             ensure_nltk_resources()
 
+    @patch("nltk.data.find")
+    def test_checks_resources_only_once(self, mock_find: patch) -> None:
+        """Test that subsequent calls skip the resource lookup."""
+        ensure_nltk_resources()
+        first_call_count = mock_find.call_count
+        ensure_nltk_resources()
+        assert mock_find.call_count == first_call_count
+
+    @patch("nltk.download")
+    @patch("nltk.data.find")
+    def test_retries_after_download_failure(
+        self, mock_find: patch, mock_download: patch
+    ) -> None:
+        """Test that a failed check is retried on the next call."""
+        mock_find.side_effect = LookupError("Not found")
+        mock_download.side_effect = Exception("Network error")
+        with pytest.raises(NLTKResourceError):
+            ensure_nltk_resources()
+        with pytest.raises(NLTKResourceError):
+            ensure_nltk_resources()
+        assert mock_download.call_count == 2
+
+
+class TestGetLemmatizer:
+    """Tests for the shared WordNet lemmatizer."""
+
+    def test_returns_shared_instance(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the lemmatizer is created once and reused."""
+        monkeypatch.setattr("barscan.analyzer.processor._lemmatizer", None)
+        with patch("barscan.analyzer.processor.WordNetLemmatizer") as mock_cls:
+            first = _get_lemmatizer()
+            second = _get_lemmatizer()
+
+        assert first is second
+        mock_cls.assert_called_once()
+        mock_cls.return_value.lemmatize.assert_called_once_with("warmup")
+
+    def test_wordnet_load_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a WordNet LookupError is raised as NLTKResourceError."""
+        monkeypatch.setattr("barscan.analyzer.processor._lemmatizer", None)
+        with patch("barscan.analyzer.processor.WordNetLemmatizer") as mock_cls:
+            mock_cls.return_value.lemmatize.side_effect = LookupError("wordnet")
+            with pytest.raises(NLTKResourceError, match="WordNet initialization failed"):
+                _get_lemmatizer()
+
 
 class TestCleanLyricsPreserveLines:
     """Tests for clean_lyrics_preserve_lines function."""
@@ -385,6 +623,18 @@ class TestCleanLyricsPreserveLines:
         with pytest.raises(EmptyLyricsError):
             clean_lyrics_preserve_lines("   \n\t  ")
 
+    def test_header_does_not_span_lines(self) -> None:
+        """Test that a bracket pair split across lines is not treated as a header."""
+        text = "[Verse\n1] Hello"
+        result = clean_lyrics_preserve_lines(text)
+        assert result == ["[Verse", "1] Hello"]
+
+    def test_inline_header_removed(self) -> None:
+        """Test that headers within a line are removed."""
+        text = "Hello [Chorus] world\n[Verse 1: Artist]\nBye"
+        result = clean_lyrics_preserve_lines(text)
+        assert result == ["Hello  world", "Bye"]
+
     def test_header_only_text(self) -> None:
         """Test text with only headers returns empty list."""
         text = "[Verse 1]\n[Chorus]\n[Bridge]"
@@ -430,6 +680,17 @@ class TestTokenizeWithPositions:
         assert first_line_tokens[0].word_index == 0
         assert first_line_tokens[1].word_index == 1
 
+    @pytest.mark.parametrize("use_nltk_tokenizer", [False, True])
+    def test_tokens_pass_model_validation(self, use_nltk_tokenizer: bool) -> None:
+        """Test that unvalidated tokens are equal to validated models."""
+        config = AnalysisConfig(language="english", use_nltk_tokenizer=use_nltk_tokenizer)
+        text = "[Verse 1]\nHello world\nGoodbye world"
+        result = tokenize_with_positions(text, song_id=1, song_title="Test", config=config)
+
+        assert result
+        for token in result:
+            assert TokenWithPosition.model_validate(token.model_dump()) == token
+
     def test_with_lemmatization(self, config_with_lemmatization: AnalysisConfig) -> None:
         """Test tokenization with lemmatization enabled."""
         text = "[Verse 1]\nThe cats are running"
@@ -447,6 +708,41 @@ class TestTokenizeWithPositions:
         with pytest.raises(EmptyLyricsError):
             tokenize_with_positions("", song_id=1, song_title="Test")
 
+    def test_with_regex_tokenizer(self) -> None:
+        """Test position tracking with the single-pass regex scan."""
+        config = AnalysisConfig(language="english")
+        text = "[Verse 1]\nI don't know\nYou know"
+        result = tokenize_with_positions(text, song_id=1, song_title="Test", config=config)
+
+        assert [t.token for t in result] == ["i", "don't", "know", "you", "know"]
+        assert [(t.line_index, t.word_index) for t in result] == [
+            (0, 0),
+            (0, 1),
+            (0, 2),
+            (1, 0),
+            (1, 1),
+        ]
+
+    def test_regex_scan_matches_per_line_normalization(self) -> None:
+        """Test the single-pass scan agrees with normalizing each line first."""
+        config = AnalysisConfig(language="english")
+        text = (
+            "[Intro]\n'Yeah,' she said -- ok?\n...\n\u0130stanbul nights\n"
+            "[Hook] Rock'n'roll, \ufb01re baby!"
+        )
+        result = tokenize_with_positions(text, song_id=1, song_title="Test", config=config)
+
+        lines = clean_lyrics_preserve_lines(text)
+        expected = [
+            (token, line_index, word_index)
+            for line_index, line in enumerate(lines)
+            for word_index, token in enumerate(tokenize(normalize_text(line, config), config))
+        ]
+        assert [(t.token, t.line_index, t.word_index) for t in result] == expected
+        assert result[-1].original_line == "Rock'n'roll, \ufb01re baby!"
+        # Lowercasing "İ" adds a combining dot, which splits the word
+        assert [t.token for t in result if t.line_index == 2] == ["i", "stanbul", "nights"]
+
     def test_with_none_config(self) -> None:
         """Test tokenization with None config uses default."""
         text = "[Verse 1]\nHello world"
@@ -454,3 +750,62 @@ class TestTokenizeWithPositions:
 
         assert len(result) > 0
         assert all(t.song_id == 1 for t in result)
+
+
+class TestTokenizeWithPositionsColumnar:
+    """Tests for tokenize_with_positions_columnar function."""
+
+    def test_columns_hold_positions(self) -> None:
+        """Test that columns contain tokens, indices, and lines."""
+        text = "[Verse 1]\nFirst line\nSecond line here"
+        columns = tokenize_with_positions_columnar(text, song_id=7, song_title="Test")
+
+        assert columns.tokens == ["first", "line", "second", "line", "here"]
+        assert list(columns.line_indices) == [0, 0, 1, 1, 1]
+        assert list(columns.word_indices) == [0, 1, 0, 1, 2]
+        assert columns.lines == ["First line", "Second line here"]
+        assert columns.song_id == 7
+
+    @pytest.mark.parametrize("use_nltk_tokenizer", [False, True])
+    def test_matches_row_oriented_output(self, use_nltk_tokenizer: bool) -> None:
+        """Test that columns convert to the same rows as tokenize_with_positions."""
+        config = AnalysisConfig(language="english", use_nltk_tokenizer=use_nltk_tokenizer)
+        text = "[Verse 1]\nHello world\n[Chorus]\nGoodbye cruel world"
+
+        columns = tokenize_with_positions_columnar(text, 1, "Test", config)
+        rows = tokenize_with_positions(text, 1, "Test", config)
+
+        assert columns.to_tokens() == rows
+
+
+class TestTokenizeWithPositionsBatch:
+    """Tests for tokenize_with_positions_batch function."""
+
+    def test_yields_one_list_per_song_in_order(self) -> None:
+        """Test that results are yielded per song in input order."""
+        lyrics_data = [
+            ("[Verse 1]\nHello world", 1, "Song 1"),
+            ("[Verse 1]\nGoodbye world", 2, "Song 2"),
+        ]
+        result = list(tokenize_with_positions_batch(lyrics_data))
+
+        assert len(result) == 2
+        assert all(t.song_id == 1 for t in result[0])
+        assert all(t.song_id == 2 for t in result[1])
+
+    def test_empty_lyrics_yield_empty_list(self) -> None:
+        """Test that songs with empty lyrics yield an empty list."""
+        lyrics_data = [("", 1, "Empty"), ("Hello world", 2, "Song 2")]
+        result = list(tokenize_with_positions_batch(lyrics_data))
+
+        assert result[0] == []
+        assert len(result[1]) == 2
+
+    def test_multiple_workers_match_sequential(self) -> None:
+        """Test that the process pool produces the same tokens as sequential processing."""
+        lyrics_data = [(f"Hello world\nSong number {i}", i, f"Song {i}") for i in range(4)]
+
+        sequential = list(tokenize_with_positions_batch(lyrics_data))
+        parallel = list(tokenize_with_positions_batch(lyrics_data, n_workers=2, chunksize=1))
+
+        assert parallel == sequential
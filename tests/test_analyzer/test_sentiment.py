@@ -1,12 +1,16 @@
 """Tests for sentiment analysis module."""
 
+from unittest.mock import patch
+
 import pytest
 
 from barscan.analyzer.sentiment import (
+    _get_analyzer,
     analyze_sentiment,
     analyze_word_sentiment,
     get_sentiment_scores,
 )
+from barscan.exceptions import NLTKResourceError
 
 
 class TestAnalyzeSentiment:
@@ -117,3 +121,40 @@ class TestGetSentimentScores:
         category, score = value
         assert category in ("positive", "negative", "neutral")
         assert isinstance(score, float)
+
+    def test_matches_full_vader_scoring(self) -> None:
+        """Test that lexicon shortcuts agree with full VADER scoring."""
+        words = ["love", "hate", "the", "table", "good!", "kinda", "no", "a", "absolutely"]
+        result = get_sentiment_scores(words)
+        for word in words:
+            assert result[word] == analyze_word_sentiment(word)
+
+
+class TestGetAnalyzer:
+    """Tests for the shared VADER analyzer."""
+
+    def test_returns_shared_instance(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the analyzer is created once and reused."""
+        monkeypatch.setattr("barscan.analyzer.sentiment._sia", None)
+        with (
+            patch("barscan.analyzer.sentiment.ensure_sentiment_resources"),
+            patch("barscan.analyzer.sentiment.SentimentIntensityAnalyzer") as mock_cls,
+        ):
+            first = _get_analyzer()
+            second = _get_analyzer()
+
+        assert first is second
+        mock_cls.assert_called_once()
+
+    def test_lexicon_load_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a VADER LookupError is raised as NLTKResourceError."""
+        monkeypatch.setattr("barscan.analyzer.sentiment._sia", None)
+        with (
+            patch("barscan.analyzer.sentiment.ensure_sentiment_resources"),
+            patch(
+                "barscan.analyzer.sentiment.SentimentIntensityAnalyzer",
+                side_effect=LookupError("vader_lexicon"),
+            ),
+            pytest.raises(NLTKResourceError, match="VADER initialization failed"),
+        ):
+            _get_analyzer()
@@ -136,6 +136,28 @@ class TestCalculateTfidfScores:
         result = calculate_tfidf_scores(word_counts, 100, doc_freqs, 10)
         assert result["unknown"] == 0.0
 
+    def test_matches_tf_times_idf(self) -> None:
+        """Test that unnormalized scores equal calculate_tf times calculate_idf."""
+        word_counts = {"love": 10, "hate": 5, "unknown": 3}
+        doc_freqs = {"love": 1, "hate": 2}
+        result = calculate_tfidf_scores(word_counts, 100, doc_freqs, 10, normalize=False)
+        for word, count in word_counts.items():
+            expected = calculate_tf(count, 100) * calculate_idf(doc_freqs.get(word, 0), 10)
+            assert result[word] == expected
+
+    def test_shared_document_frequency(self) -> None:
+        """Test that words with the same document frequency share the same IDF."""
+        word_counts = {"love": 4, "hate": 2}
+        doc_freqs = {"love": 2, "hate": 2}
+        result = calculate_tfidf_scores(word_counts, 100, doc_freqs, 10, normalize=False)
+        assert result["love"] == 0.04 * math.log(5)
+        assert result["hate"] == 0.02 * math.log(5)
+
+    def test_zero_total_words(self) -> None:
+        """Test that zero total words yields zero scores."""
+        result = calculate_tfidf_scores({"love": 1}, 0, {"love": 1}, 10)
+        assert result == {"love": 0.0}
+
 
 class TestCalculateCorpusTfidf:
     """Tests for calculate_corpus_tfidf function."""
@@ -176,3 +198,15 @@ class TestCalculateCorpusTfidf:
         aggregate_counts = {"rare": 10, "common": 1}
         result = calculate_corpus_tfidf(word_counts_per_song, aggregate_counts, 11)
         assert max(result.values()) == 1.0
+
+    def test_aggregate_counts_computed_when_omitted(self) -> None:
+        """Test that omitted aggregate counts and total are derived from the songs."""
+        word_counts_per_song = [
+            Counter({"love": 5, "music": 3}),
+            Counter({"love": 2, "dance": 4}),
+            Counter({"music": 2, "dance": 1}),
+        ]
+        expected = calculate_corpus_tfidf(
+            word_counts_per_song, {"love": 7, "music": 5, "dance": 5}, 17
+        )
+        assert calculate_corpus_tfidf(word_counts_per_song) == expected
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +13,7 @@ from barscan.analyzer.tokenizer import (
     MEANINGFUL_POS,
     EnglishTokenizer,
     JapaneseTokenizer,
+    _word_tokenize_cached,
     detect_language,
     get_tokenizer,
     is_japanese_char,
@@ -19,6 +22,17 @@ from barscan.analyzer.tokenizer import (
 )
 
 
+class _Tok:
+    """Lightweight stand-in for a Janome token."""
+
+    __slots__ = ("surface", "base_form", "part_of_speech")
+
+    def __init__(self, surface: str, base_form: str, part_of_speech: str = "名詞,一般,*,*") -> None:
+        self.surface = surface
+        self.base_form = base_form
+        self.part_of_speech = part_of_speech
+
+
 class TestMeaningfulPOS:
     """Tests for MEANINGFUL_POS constant."""
 
@@ -112,6 +126,14 @@ class TestIsJapaneseText:
         """Test numbers-only text returns False."""
         assert is_japanese_text("12345") is False
 
+    def test_matches_is_japanese_char(self) -> None:
+        """Test that the regex scan agrees with is_japanese_char on range boundaries."""
+        boundaries = [0x303F, 0x3040, 0x30FF, 0x3100, 0x31EF, 0x31F0, 0x31FF, 0x3200]
+        boundaries += [0x4DFF, 0x4E00, 0x9FFF, 0xA000, 0xFF64, 0xFF65, 0xFF9F, 0xFFA0]
+        for code in boundaries:
+            char = chr(code)
+            assert is_japanese_text(f"abc {char}") is is_japanese_char(char)
+
 
 class TestDetectLanguage:
     """Tests for detect_language function."""
@@ -155,6 +177,15 @@ class TestNormalizeTextForLanguage:
         result = normalize_text_for_language("don't can't", "english")
         assert "'" in result
 
+    def test_english_ascii_fast_path_matches_unicode_path(self) -> None:
+        """Test the ASCII bytes path gives the same result as the regex path."""
+        text = "'Yo,' she said -- we're (ROCKIN') tonight!! snake_case #1 \x01ok"
+        # Appending a non-ASCII word forces the general path for comparison
+        fast = normalize_text_for_language(text, "english")
+        general = normalize_text_for_language(text + " caf\u00e9", "english")
+        assert fast == "yo she said we're rockin tonight snake_case 1 ok"
+        assert general == fast + " caf\u00e9"
+
     def test_japanese_nfkc_normalization(self) -> None:
         """Test Japanese uses NFKC normalization."""
         # Full-width numbers to half-width
@@ -184,12 +215,32 @@ class TestEnglishTokenizer:
         assert "hello" in tokens
         assert "world" in tokens
 
+    def test_tokenize_repeated_input_is_cached(self) -> None:
+        """Test that repeated inputs reuse the cached tokenization."""
+        _word_tokenize_cached.cache_clear()
+        with patch("barscan.analyzer.tokenizer.word_tokenize") as mock_tokenize:
+            mock_tokenize.return_value = ["round", "and", "round"]
+            tokenizer = EnglishTokenizer()
+            first = tokenizer.tokenize("round and round")
+            second = tokenizer.tokenize("round and round")
+        _word_tokenize_cached.cache_clear()
+
+        assert first == second == ["round", "and", "round"]
+        assert first is not second
+        mock_tokenize.assert_called_once()
+
     def test_get_base_forms(self) -> None:
         """Test get_base_forms returns same as tokenize."""
         tokenizer = EnglishTokenizer()
         tokens = tokenizer.get_base_forms("hello world")
         assert tokens == ["hello", "world"]
 
+    def test_tokenize_many(self) -> None:
+        """Test tokenize_many yields one token list per text."""
+        tokenizer = EnglishTokenizer()
+        result = list(tokenizer.tokenize_many(["hello world", "goodbye"]))
+        assert result == [["hello", "world"], ["goodbye"]]
+
 
 class TestJapaneseTokenizer:
     """Tests for JapaneseTokenizer class."""
@@ -202,28 +253,40 @@ class TestJapaneseTokenizer:
     def test_tokenize_raises_import_error_when_janome_not_installed(self) -> None:
         """Test ImportError is raised when Janome is not installed."""
         tokenizer = JapaneseTokenizer()
-        with patch.dict("sys.modules", {"janome": None, "janome.tokenizer": None}):
-            # Force re-import by clearing cached tokenizer
-            tokenizer._tokenizer = None
-            with patch(
-                "barscan.analyzer.tokenizer.JapaneseTokenizer._get_tokenizer",
-                side_effect=ImportError("Janome is required"),
-            ):
-                with pytest.raises(ImportError, match="Janome is required"):
-                    tokenizer.tokenize("テスト")
+        with patch(
+            "barscan.analyzer.tokenizer.JapaneseTokenizer._get_tokenizer",
+            side_effect=ImportError("Janome is required"),
+        ):
+            with pytest.raises(ImportError, match="Janome is required"):
+                tokenizer.tokenize("テスト")
+
+    def test_import_does_not_load_janome(self) -> None:
+        """Test that importing the tokenizer module does not import Janome."""
+        code = (
+            "import sys, barscan.analyzer.tokenizer; "
+            "sys.exit('janome' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_instances_share_janome_tokenizer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the Janome dictionary is loaded once for all instances."""
+        monkeypatch.setattr("barscan.analyzer.tokenizer._janome_tokenizer", None)
+        mock_module = MagicMock()
+        with patch.dict("sys.modules", {"janome": MagicMock(), "janome.tokenizer": mock_module}):
+            first = JapaneseTokenizer()._get_tokenizer()
+            second = JapaneseTokenizer()._get_tokenizer()
+
+        assert first is second
+        mock_module.Tokenizer.assert_called_once()
 
     def test_tokenize_with_mock_janome(self) -> None:
         """Test tokenization with mocked Janome."""
         tokenizer = JapaneseTokenizer()
 
         # Create mock token objects
-        mock_token1 = MagicMock()
-        mock_token1.surface = "こんにちは"
-        mock_token1.base_form = "こんにちは"
-
-        mock_token2 = MagicMock()
-        mock_token2.surface = "世界"
-        mock_token2.base_form = "世界"
+        mock_token1 = _Tok("こんにちは", "こんにちは")
+        mock_token2 = _Tok("世界", "世界")
 
         # Create mock Janome tokenizer
         mock_janome_tokenizer = MagicMock()
@@ -239,9 +302,7 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Create mock token with different surface and base forms
-        mock_token = MagicMock()
-        mock_token.surface = "食べた"
-        mock_token.base_form = "食べる"
+        mock_token = _Tok("食べた", "食べる")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_token]
@@ -255,9 +316,7 @@ class TestJapaneseTokenizer:
         """Test surface form is used when base_form is '*'."""
         tokenizer = JapaneseTokenizer()
 
-        mock_token = MagicMock()
-        mock_token.surface = "テスト"
-        mock_token.base_form = "*"
+        mock_token = _Tok("テスト", "*")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_token]
@@ -272,9 +331,7 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Mock token with different surface and base forms
-        mock_token = MagicMock()
-        mock_token.surface = "食べた"  # Surface form (past tense)
-        mock_token.base_form = "食べる"  # Base form (dictionary form)
+        mock_token = _Tok(surface="食べた", base_form="食べる")  # Past tense -> dictionary form
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_token]
@@ -289,20 +346,9 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Create mock tokens for different parts of speech
-        mock_noun = MagicMock()
-        mock_noun.surface = "猫"
-        mock_noun.base_form = "猫"
-        mock_noun.part_of_speech = "名詞,一般,*,*"
-
-        mock_verb = MagicMock()
-        mock_verb.surface = "走る"
-        mock_verb.base_form = "走る"
-        mock_verb.part_of_speech = "動詞,自立,*,*"
-
-        mock_adjective = MagicMock()
-        mock_adjective.surface = "高い"
-        mock_adjective.base_form = "高い"
-        mock_adjective.part_of_speech = "形容詞,自立,*,*"
+        mock_noun = _Tok("猫", "猫", "名詞,一般,*,*")
+        mock_verb = _Tok("走る", "走る", "動詞,自立,*,*")
+        mock_adjective = _Tok("高い", "高い", "形容詞,自立,*,*")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_noun, mock_verb, mock_adjective]
@@ -319,15 +365,8 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Create mock tokens: noun + particle
-        mock_noun = MagicMock()
-        mock_noun.surface = "猫"
-        mock_noun.base_form = "猫"
-        mock_noun.part_of_speech = "名詞,一般,*,*"
-
-        mock_particle = MagicMock()
-        mock_particle.surface = "が"
-        mock_particle.base_form = "が"
-        mock_particle.part_of_speech = "助詞,格助詞,一般,*"
+        mock_noun = _Tok("猫", "猫", "名詞,一般,*,*")
+        mock_particle = _Tok("が", "が", "助詞,格助詞,一般,*")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_noun, mock_particle]
@@ -343,15 +382,8 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Create mock tokens: verb stem + auxiliary (たい)
-        mock_verb = MagicMock()
-        mock_verb.surface = "食べ"
-        mock_verb.base_form = "食べる"
-        mock_verb.part_of_speech = "動詞,自立,*,*"
-
-        mock_auxiliary = MagicMock()
-        mock_auxiliary.surface = "たい"
-        mock_auxiliary.base_form = "たい"
-        mock_auxiliary.part_of_speech = "助動詞,*,*,*"
+        mock_verb = _Tok("食べ", "食べる", "動詞,自立,*,*")
+        mock_auxiliary = _Tok("たい", "たい", "助動詞,*,*,*")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_verb, mock_auxiliary]
@@ -366,10 +398,7 @@ class TestJapaneseTokenizer:
         """Test POS filtering uses base forms, not surface forms."""
         tokenizer = JapaneseTokenizer()
 
-        mock_verb = MagicMock()
-        mock_verb.surface = "走った"  # Surface form (past tense)
-        mock_verb.base_form = "走る"  # Base form
-        mock_verb.part_of_speech = "動詞,自立,*,*"
+        mock_verb = _Tok(surface="走った", base_form="走る", part_of_speech="動詞,自立,*,*")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_verb]
@@ -384,15 +413,8 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Create mock tokens: verb + non-independent verb (てる)
-        mock_verb = MagicMock()
-        mock_verb.surface = "見"
-        mock_verb.base_form = "見る"
-        mock_verb.part_of_speech = "動詞,自立,*,*"
-
-        mock_teru = MagicMock()
-        mock_teru.surface = "てる"
-        mock_teru.base_form = "てる"
-        mock_teru.part_of_speech = "動詞,非自立,*,*"  # Non-independent verb
+        mock_verb = _Tok("見", "見る", "動詞,自立,*,*")
+        mock_teru = _Tok("てる", "てる", "動詞,非自立,*,*")  # Non-independent verb
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_verb, mock_teru]
@@ -408,15 +430,8 @@ class TestJapaneseTokenizer:
         tokenizer = JapaneseTokenizer()
 
         # Create mock tokens: noun + suffix
-        mock_noun = MagicMock()
-        mock_noun.surface = "田中"
-        mock_noun.base_form = "田中"
-        mock_noun.part_of_speech = "名詞,固有名詞,人名,姓"
-
-        mock_suffix = MagicMock()
-        mock_suffix.surface = "さん"
-        mock_suffix.base_form = "さん"
-        mock_suffix.part_of_speech = "名詞,接尾,人名,*"
+        mock_noun = _Tok("田中", "田中", "名詞,固有名詞,人名,姓")
+        mock_suffix = _Tok("さん", "さん", "名詞,接尾,人名,*")
 
         mock_janome_tokenizer = MagicMock()
         mock_janome_tokenizer.tokenize.return_value = [mock_noun, mock_suffix]
@@ -427,6 +442,57 @@ class TestJapaneseTokenizer:
         assert tokens == ["田中"]
         assert "さん" not in tokens
 
+    def test_tokenize_with_pos_filter_single_field_pos(self) -> None:
+        """Test POS filtering handles a POS tag without subcategories."""
+        tokenizer = JapaneseTokenizer()
+
+        mock_noun = _Tok("猫", "猫", "名詞")
+
+        mock_janome_tokenizer = MagicMock()
+        mock_janome_tokenizer.tokenize.return_value = [mock_noun]
+
+        tokenizer._tokenizer = mock_janome_tokenizer
+
+        assert tokenizer.tokenize_with_pos_filter("猫") == ["猫"]
+
+    def test_iter_variants_are_lazy(self) -> None:
+        """Test iter_* methods stream the same tokens as the list methods."""
+        tokenizer = JapaneseTokenizer()
+
+        mock_noun = _Tok("猫", "猫", "名詞,一般,*,*")
+        mock_particle = _Tok("が", "が", "助詞,格助詞,一般,*")
+
+        mock_janome_tokenizer = MagicMock()
+        mock_janome_tokenizer.tokenize.side_effect = lambda text: iter(
+            [mock_noun, mock_particle]
+        )
+
+        tokenizer._tokenizer = mock_janome_tokenizer
+
+        base_forms = tokenizer.iter_base_forms("猫が")
+        content_words = tokenizer.iter_tokens_with_pos_filter("猫が")
+        assert not isinstance(base_forms, list)
+        assert list(base_forms) == tokenizer.get_base_forms("猫が") == ["猫", "が"]
+        assert list(content_words) == tokenizer.tokenize_with_pos_filter("猫が") == ["猫"]
+
+    def test_tokenize_many_with_pos_filter(self) -> None:
+        """Test tokenize_many applies POS filtering to each text."""
+        tokenizer = JapaneseTokenizer()
+
+        mock_noun = _Tok("猫", "猫", "名詞,一般,*,*")
+        mock_particle = _Tok("が", "が", "助詞,格助詞,一般,*")
+
+        mock_janome_tokenizer = MagicMock()
+        mock_janome_tokenizer.tokenize.side_effect = lambda text: (
+            [mock_noun, mock_particle] if text == "猫が" else [mock_noun]
+        )
+
+        tokenizer._tokenizer = mock_janome_tokenizer
+
+        texts = ["猫が", "猫"]
+        assert list(tokenizer.tokenize_many(texts)) == [["猫", "が"], ["猫"]]
+        assert list(tokenizer.tokenize_many(texts, pos_filter=True)) == [["猫"], ["猫"]]
+
 
 class TestGetTokenizer:
     """Tests for get_tokenizer factory function."""
@@ -455,3 +521,13 @@ class TestGetTokenizer:
         """Test auto without text returns English tokenizer."""
         tokenizer = get_tokenizer("auto")
         assert isinstance(tokenizer, EnglishTokenizer)
+
+    def test_returns_shared_instances(self) -> None:
+        """Test that repeated calls return the same tokenizer instance."""
+        assert get_tokenizer("english") is get_tokenizer("auto", "hello world")
+        assert get_tokenizer("japanese") is get_tokenizer("auto", "こんにちは")
+
+    def test_tokenizers_have_no_instance_dict(self) -> None:
+        """Test that tokenizers use __slots__ instead of a per-instance __dict__."""
+        assert not hasattr(EnglishTokenizer(), "__dict__")
+        assert not hasattr(JapaneseTokenizer(), "__dict__")
@@ -1,28 +1,79 @@
 """Shared fixtures for CLI tests."""
 
+import io
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple
+from unittest.mock import Mock
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
+from barscan.cli import app
+from barscan.genius.cache import LyricsCache
+from barscan.genius.client import GeniusClient
 
-@pytest.fixture
+
+class CommandResult(NamedTuple):
+    """Exit code and combined stdout/stderr of a directly called command."""
+
+    exit_code: int
+    output: str
+
+
+@lru_cache(maxsize=1)
+def _command_callbacks() -> dict[str, Callable[..., Any]]:
+    """Map CLI command names to their callbacks, as Typer names them."""
+    return {
+        info.name or info.callback.__name__.replace("_", "-"): info.callback
+        for info in app.registered_commands
+        if info.callback is not None
+    }
+
+
+def _call_command(name: str, **kwargs: Any) -> CommandResult:
+    """Call a command callback in-process, bypassing Click parsing.
+
+    Arguments are passed as Python values, so option parsing and parameter
+    callbacks do not run. Use ``cli_runner`` for tests that exercise them.
+    """
+    buffer = io.StringIO()
+    exit_code = 0
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        try:
+            _command_callbacks()[name](**kwargs)
+        except typer.Exit as e:
+            exit_code = e.exit_code
+    return CommandResult(exit_code=exit_code, output=buffer.getvalue())
+
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared by the whole session."""
     return CliRunner()
 
 
-@pytest.fixture
-def temp_cache_dir(tmp_path: Path) -> Path:
-    """Temporary directory for cache testing."""
-    cache_dir = tmp_path / "cache"
-    cache_dir.mkdir()
-    return cache_dir
+@pytest.fixture(scope="session")
+def call_command():
+    """Return a helper that calls a CLI command callback directly."""
+    return _call_command
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def temp_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Temporary cache directory shared by the CLI tests.
+
+    LyricsCache is mocked in these tests, so nothing is written here.
+    """
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(scope="session")
 def mock_settings(temp_cache_dir: Path):
-    """Mock Settings object for testing."""
+    """Mock Settings object for testing, shared because no test mutates it."""
     from barscan.config import Settings
 
     return Settings(
@@ -34,7 +85,55 @@ def mock_settings(temp_cache_dir: Path):
     )
 
 
+@pytest.fixture(scope="session")
+def no_token_settings(temp_cache_dir: Path):
+    """Settings without a Genius API token."""
+    from barscan.config import Settings
+
+    return Settings(genius_access_token="", cache_dir=temp_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def short_token_settings(temp_cache_dir: Path):
+    """Settings with a token too short to mask partially."""
+    from barscan.config import Settings
+
+    return Settings(genius_access_token="abc", cache_dir=temp_cache_dir)
+
+
+@pytest.fixture(autouse=True)
+def patched_cli_settings(monkeypatch: pytest.MonkeyPatch, mock_settings):
+    """Install mock_settings as the settings used by the CLI commands.
+
+    Tests that need different settings can call ``monkeypatch.setattr`` again.
+    """
+    monkeypatch.setattr("barscan.cli.settings", mock_settings)
+    return mock_settings
+
+
+@pytest.fixture
+def mock_cache(monkeypatch: pytest.MonkeyPatch):
+    """Patch the CLI's LyricsCache and return the instance it constructs."""
+    cache = Mock(spec=LyricsCache)
+    monkeypatch.setattr("barscan.cli.LyricsCache", Mock(return_value=cache))
+    return cache
+
+
+@pytest.fixture
+def mock_client_class(monkeypatch: pytest.MonkeyPatch):
+    """Patch the CLI's GeniusClient class and return the patched class."""
+    client_class = Mock(return_value=Mock(spec=GeniusClient))
+    monkeypatch.setattr("barscan.cli.GeniusClient", client_class)
+    return client_class
+
+
 @pytest.fixture
+def mock_client(mock_client_class):
+    """Return the GeniusClient instance the patched CLI constructs."""
+    return mock_client_class.return_value
+
+
+@pytest.fixture(scope="session")
 def mock_artist():
     """Create a mock Artist model."""
     from barscan.genius.models import Artist
@@ -48,7 +147,7 @@ def mock_artist():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_song():
     """Create a mock Song model."""
     from barscan.genius.models import Song
@@ -65,7 +164,7 @@ def mock_song():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_lyrics():
     """Create a mock Lyrics model."""
     from barscan.genius.models import Lyrics
@@ -78,7 +177,7 @@ def mock_lyrics():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_artist_with_songs(mock_artist, mock_song):
     """Create a mock ArtistWithSongs model."""
     from barscan.genius.models import ArtistWithSongs
@@ -88,3 +187,26 @@ def mock_artist_with_songs(mock_artist, mock_song):
         songs=[mock_song],
         total_songs_fetched=1,
     )
+
+
+@pytest.fixture(scope="session")
+def mock_artist_with_three_songs(mock_artist):
+    """Create a mock ArtistWithSongs model with three songs."""
+    from barscan.genius.models import ArtistWithSongs, Song
+
+    songs = [
+        Song(
+            id=i,
+            title=f"Song {i}",
+            title_with_featured=f"Song {i}",
+            artist="Test Artist",
+            artist_id=123,
+            url=f"https://genius.com/song-{i}",
+        )
+        for i in range(3)
+    ]
+    return ArtistWithSongs(
+        artist=mock_artist,
+        songs=songs,
+        total_songs_fetched=3,
+    )
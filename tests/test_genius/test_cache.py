@@ -1,8 +1,13 @@
 """Tests for LyricsCache."""
 
+import os
+import stat
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 from barscan.genius.cache import LyricsCache
 from barscan.genius.models import Lyrics
 
@@ -240,6 +245,39 @@ class TestCacheEdgeCases:
         stats = cache.get_stats()
         assert stats["total_entries"] == 10
 
+    def test_store_leaves_no_temp_files(self, temp_cache_dir: Path):
+        """Test that storing renames its temp file into place."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+        lyrics = Lyrics(song_id=42, song_title="Song", artist_name="Artist", lyrics_text="v1")
+
+        cache.store_lyrics(lyrics)
+        cache.store_lyrics(lyrics.model_copy(update={"lyrics_text": "v2"}))
+
+        shard = cache._cache_path(42).parent
+        assert [p.name for p in shard.iterdir()] == ["42.json"]
+        retrieved = cache.get_lyrics(42)
+        assert retrieved is not None
+        assert retrieved.lyrics_text == "v2"
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_store_uses_umask_file_mode(self, temp_cache_dir: Path):
+        """Test that entries get the umask-derived mode, not mkstemp's 0600."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+        cache.store_lyrics(
+            Lyrics(song_id=43, song_title="Song", artist_name="Artist", lyrics_text="Text")
+        )
+
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(cache._cache_path(43).stat().st_mode) == 0o666 & ~umask
+
+    def test_lookup_does_not_create_shard_directory(self, temp_cache_dir: Path):
+        """Test that a cache miss leaves the shard directory uncreated."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+
+        assert cache.get_lyrics(12345) is None
+        assert not cache._cache_path(12345).parent.exists()
+
     def test_clear_on_nonexistent_directory(self, temp_cache_dir: Path):
         """Test clearing cache when cache directory doesn't exist."""
         cache = LyricsCache(cache_dir=temp_cache_dir / "nonexistent")
@@ -303,6 +341,37 @@ class TestCacheEdgeCases:
         # Valid file should still exist
         assert cache.get_lyrics(1) is not None
 
+    def test_incomplete_entry_treated_alike_by_all_readers(self, temp_cache_dir: Path):
+        """Test that an entry get_lyrics rejects is also invalid for stats and clears."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+
+        # Fresh fetched_at, but the lyrics fields are missing
+        cache_path = cache._get_cache_path(300)
+        cache_path.write_text(
+            f'{{"song_id": 300, "fetched_at": "{datetime.now(UTC).isoformat()}"}}',
+            encoding="utf-8",
+        )
+
+        assert cache.get_stats()["expired"] == 1
+        assert cache_path.exists()  # get_stats never deletes
+        assert cache.clear_expired() == 1
+        assert not cache_path.exists()
+
+    def test_entry_without_fetched_at_counts_as_expired(self, temp_cache_dir: Path):
+        """Test that stats and clears treat an entry without fetched_at as expired."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+
+        cache_path = cache._get_cache_path(310)
+        cache_path.write_text(
+            '{"song_id": 310, "song_title": "Test", "artist_name": "Artist", '
+            '"lyrics_text": "Text"}',
+            encoding="utf-8",
+        )
+
+        assert cache.get_stats()["expired"] == 1
+        assert cache.clear_expired() == 1
+        assert not cache_path.exists()
+
     def test_handles_missing_keys_in_cache_file(self, temp_cache_dir: Path):
         """Test handling of cache files with missing required keys."""
         cache = LyricsCache(cache_dir=temp_cache_dir)
@@ -321,6 +390,20 @@ class TestCacheEdgeCases:
         assert result is None  # Should return None for incomplete data
         assert not cache_path.exists()  # File should be cleaned up
 
+    def test_handles_missing_fetched_at_in_cache_file(self, temp_cache_dir: Path):
+        """Test that an entry without fetched_at is invalid, not stamped as fresh."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+
+        cache_path = cache._get_cache_path(150)
+        cache_path.write_text(
+            '{"song_id": 150, "song_title": "Test", "artist_name": "Artist", '
+            '"lyrics_text": "Text"}',
+            encoding="utf-8",
+        )
+
+        assert cache.get_lyrics(150) is None
+        assert not cache_path.exists()
+
     def test_handles_invalid_datetime_in_cache(self, temp_cache_dir: Path):
         """Test handling of cache files with invalid datetime."""
         cache = LyricsCache(cache_dir=temp_cache_dir)
@@ -438,6 +521,27 @@ class TestCacheEdgeCases:
         # Size should be at least 1000 bytes (for the lyrics text)
         assert stats["size_bytes"] > 1000
 
+    def test_cache_file_keeps_json_format(self, temp_cache_dir: Path):
+        """Test that stored entries stay plain JSON with an ISO fetched_at."""
+        import json
+
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+        fetched_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        cache.store_lyrics(
+            Lyrics(
+                song_id=700,
+                song_title="Format",
+                artist_name="Artist",
+                lyrics_text="日本語",
+                fetched_at=fetched_at,
+            )
+        )
+
+        data = json.loads(cache._get_cache_path(700).read_text(encoding="utf-8"))
+        assert data["song_id"] == 700
+        assert data["lyrics_text"] == "日本語"
+        assert datetime.fromisoformat(data["fetched_at"]) == fetched_at
+
     def test_timezone_naive_datetime_handling(self, temp_cache_dir: Path):
         """Test handling of timezone-naive datetimes in cache."""
         cache = LyricsCache(cache_dir=temp_cache_dir, ttl_hours=24)
@@ -461,3 +565,102 @@ class TestCacheEdgeCases:
         result = cache.get_lyrics(600)
         assert result is not None
         assert result.song_id == 600
+
+
+class TestBackgroundSweep:
+    """Tests for the opt-in background TTL sweeper."""
+
+    def test_no_sweeper_by_default(self, temp_cache_dir: Path):
+        """Test that no timer is started unless an interval is given."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+        assert cache._sweep_timer is None
+
+    def test_invalid_interval_rejected(self, temp_cache_dir: Path):
+        """Test that a non-positive sweep interval is rejected."""
+        with pytest.raises(ValueError):
+            LyricsCache(cache_dir=temp_cache_dir, sweep_interval_seconds=0)
+
+    def test_sweeper_removes_expired_entries(self, temp_cache_dir: Path):
+        """Test that the sweeper clears expired entries without being called."""
+        cache = LyricsCache(cache_dir=temp_cache_dir, ttl_hours=1)
+        cache.store_lyrics(
+            Lyrics(
+                song_id=1,
+                song_title="Old",
+                artist_name="Artist",
+                lyrics_text="Old lyrics",
+                fetched_at=datetime.now(UTC) - timedelta(hours=2),
+            )
+        )
+        cache.store_lyrics(
+            Lyrics(song_id=2, song_title="New", artist_name="Artist", lyrics_text="New lyrics")
+        )
+        expired_path = cache._cache_path(1)
+
+        swept = LyricsCache(cache_dir=temp_cache_dir, ttl_hours=1, sweep_interval_seconds=0.01)
+        try:
+            deadline = time.monotonic() + 5
+            while expired_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            swept.close()
+
+        assert not expired_path.exists()
+        assert cache._cache_path(2).exists()
+
+    def test_close_stops_sweeper(self, temp_cache_dir: Path):
+        """Test that close cancels the timer and prevents re-arming."""
+        cache = LyricsCache(cache_dir=temp_cache_dir, sweep_interval_seconds=60)
+        timer = cache._sweep_timer
+        assert timer is not None
+
+        cache.close()
+
+        assert cache._sweep_timer is None
+        timer.join(timeout=1)
+        assert not timer.is_alive()
+        cache._schedule_sweep(60)
+        assert cache._sweep_timer is None
+
+    def test_sweep_rearms_after_unexpected_error(
+        self, temp_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a sweep failing with a non-OSError still schedules the next one."""
+        cache = LyricsCache(cache_dir=temp_cache_dir)
+
+        def fail() -> int:
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(cache, "clear_expired", fail)
+        try:
+            cache._sweep(60)
+            assert cache._sweep_timer is not None
+        finally:
+            cache.close()
+
+    def test_readers_tolerate_concurrently_removed_entries(
+        self, temp_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that stats and clears neither count nor fail on entries removed after listing."""
+        cache = LyricsCache(cache_dir=temp_cache_dir, ttl_hours=1)
+        cache.store_lyrics(
+            Lyrics(
+                song_id=1,
+                song_title="Old",
+                artist_name="Artist",
+                lyrics_text="Old lyrics",
+                fetched_at=datetime.now(UTC) - timedelta(hours=2),
+            )
+        )
+
+        # Simulate a sweep deleting the file between listing and use
+        stale_entries = list(cache._iter_cache_entries())
+        for entry in stale_entries:
+            Path(entry.path).unlink()
+        monkeypatch.setattr(cache, "_iter_cache_entries", lambda: iter(stale_entries))
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 0
+        assert stats["expired"] == 0
+        assert cache.clear_expired() == 0
+        assert cache.clear() == 0
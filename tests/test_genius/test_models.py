@@ -107,6 +107,16 @@ class TestLyrics:
         )
         assert lyrics.is_empty
 
+    def test_lyrics_immutable(self):
+        lyrics = Lyrics(
+            song_id=456,
+            song_title="Test Song",
+            artist_name="Test Artist",
+            lyrics_text="Hello",
+        )
+        with pytest.raises(ValidationError):
+            lyrics.lyrics_text = "Changed"
+
     def test_word_count(self):
         lyrics = Lyrics(
             song_id=456,